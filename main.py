@@ -9,17 +9,23 @@ root = Path(__file__).resolve().parent
 sys.path.append(str(root / "src"))
 
 from core.app_context import AppContext
+from core.log_config import setup_logging
 
 
 def main():
-    print("### Auto Trading System Start ###")
+    log_listener = setup_logging()
 
-    # AppContext 초기화 (Google Sheets / Schema / Broker / Engine 로드)
-    ctx = AppContext(root)
+    try:
+        print("### Auto Trading System Start ###")
 
-    print("\n### 포트폴리오 상태 ###")
-    state = ctx.portfolio.build_portfolio_state()
-    print(state)
+        # AppContext 초기화 (Google Sheets / Schema / Broker / Engine 로드)
+        ctx = AppContext(root)
+
+        print("\n### 포트폴리오 상태 ###")
+        state = ctx.portfolio.build_portfolio_state()
+        print(state)
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -2,11 +2,6 @@
 
 import os
 import sys
-from dotenv import load_dotenv
-import pathlib
-
-ROOT = pathlib.Path(__file__).resolve().parents[2]  # 프로젝트 루트
-load_dotenv(ROOT / ".env")
 
 # src 폴더를 import path에 추가 (모듈 실행 오류 방지)
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -14,7 +9,7 @@ ROOT_DIR = os.path.abspath(os.path.join(CURRENT_DIR, "../.."))
 SRC_DIR = os.path.join(ROOT_DIR, "src")
 sys.path.append(SRC_DIR)
 
-from brokers.kis_broker import KISBroker
+from brokers.kis_broker import KISBroker  # .env 는 core.settings 에서 1회 로드
 
 
 def test_broker():
@@ -1,23 +1,23 @@
-import os
+import sys
 import pathlib
-from dotenv import load_dotenv
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
-env_path = ROOT / ".env"
+sys.path.append(str(ROOT / "src"))
 
-print("ENV_PATH:", env_path)
-load_dotenv(env_path)
+from core.settings import ENV_PATH, settings
+
+print("ENV_PATH:", ENV_PATH)
 
 # 모드
-print("KIS_MODE =", os.getenv("KIS_MODE"))
-print("ENABLE_REAL_ORDER =", os.getenv("ENABLE_REAL_ORDER"))
+print("KIS_MODE =", settings.kis_mode)
+print("ENABLE_REAL_ORDER =", settings.enable_real_order)
 
 # REAL 값
-print("REAL_APP_KEY =", os.getenv("REAL_APP_KEY"))
-print("REAL_APP_SECRET =", os.getenv("REAL_APP_SECRET"))
-print("REAL_ACCOUNT_NO =", os.getenv("REAL_ACCOUNT_NO"))
-print("REAL_ACNT_PRDT_CD =", os.getenv("REAL_ACNT_PRDT_CD"))
-print("REAL_BASE_URL =", os.getenv("REAL_BASE_URL"))
+print("REAL_APP_KEY =", settings.real.app_key)
+print("REAL_APP_SECRET =", settings.real.app_secret)
+print("REAL_ACCOUNT_NO =", settings.real.account_no)
+print("REAL_ACNT_PRDT_CD =", settings.real.acnt_prdt_cd)
+print("REAL_BASE_URL =", settings.real.base_url)
 
 # VTS 값
-print("VTS_BASE_URL =", os.getenv("VTS_BASE_URL"))
+print("VTS_BASE_URL =", settings.vts.base_url)
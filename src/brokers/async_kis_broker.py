@@ -0,0 +1,152 @@
+# src/brokers/async_kis_broker.py
+# 한국투자증권 OpenAPI(REST) 비동기 조회 브로커 (httpx.AsyncClient 기반)
+# 시세/잔고/보유종목 조회를 하나의 이벤트 루프에서 동시에 실행 (주문은 동기 KISBroker 경로 유지)
+
+import asyncio
+import logging
+import time
+from typing import Dict, List
+
+try:
+    import httpx  # 선택 의존성: 비동기 브로커 사용 시에만 필요
+except ImportError:
+    httpx = None
+
+from brokers.kis_broker import (
+    KISBroker,
+    POOL_MAXSIZE,
+    loads_response,
+    save_cached_token,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncKISBroker(KISBroker):
+    """
+    KISBroker 비동기 조회 버전
+    - get_price_async / get_prices_async / get_balance_async / get_positions_async 가 coroutine
+    - 동기 get_price / get_balance / get_positions 등은 KISBroker 그대로 (BrokerInterface 계약 유지)
+    - 토큰/헤더 템플릿/응답 파싱은 KISBroker 와 공유
+    - 토큰 갱신은 asyncio.Lock 으로 직렬화
+    """
+
+    def __init__(self, mode: str | None = None, http2: bool = False, timeout: float = 5.0):
+        if httpx is None:
+            raise ImportError("AsyncKISBroker requires 'httpx' (pip install httpx)")
+
+        super().__init__(mode=mode)
+
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=POOL_MAXSIZE,
+                max_connections=POOL_MAXSIZE * 2,
+            ),
+            timeout=timeout,
+            headers={
+                "appKey": self.app_key or "",
+                "appSecret": self.app_secret or "",
+            },
+        )
+        self._token_lock = asyncio.Lock()
+
+    # ===========================================================
+    # Token 발급 + 캐싱 (async)
+    # ===========================================================
+    async def get_token_async(self):
+        if self.access_token and time.time() < self.token_expiry - 60:
+            return self.access_token
+
+        async with self._token_lock:
+            now = time.time()
+            if self.access_token and now < self.token_expiry - 60:
+                return self.access_token
+
+            res = await self._client.post(
+                self.TOKEN_URL,
+                headers={"Content-Type": "application/json; charset=utf-8"},
+                content=self._token_payload,
+            )
+            res.raise_for_status()
+
+            token = loads_response(res.content)["access_token"]
+            expiry = now + 3500  # 약 1시간
+
+            self._set_token(token, expiry)
+            save_cached_token(self.mode, {"access_token": token, "expiry": expiry})
+            return token
+
+    async def _build_headers_async(self, tr_id="", include_content_type=False):
+        await self.get_token_async()
+
+        template = self._post_headers if include_content_type else self._get_headers
+        headers = template.copy()
+        headers["tr_id"] = tr_id
+        return headers
+
+    # ===========================================================
+    # 국내 현재가 조회 (async)
+    # ===========================================================
+    async def get_price_async(self, symbol: str) -> float:
+        headers = await self._build_headers_async("FHKST01010100")
+        url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
+
+        params = {
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_INPUT_ISCD": symbol
+        }
+
+        r = await self._client.get(url, headers=headers, params=params)
+        try:
+            r.raise_for_status()
+        except Exception:
+            logger.warning("[국내 시세 조회 오류] %s RESPONSE: %s", symbol, r.text)
+            return 0.0
+
+        return float(loads_response(r.content)["output"]["stck_prpr"])
+
+    async def get_prices_async(self, symbols: List[str]) -> Dict[str, float]:
+        """여러 종목 현재가를 asyncio.gather 로 동시 조회"""
+        unique = list(dict.fromkeys(symbols))
+
+        # 토큰은 gather 전에 1회 확보
+        await self.get_token_async()
+
+        prices = await asyncio.gather(*(self.get_price_async(s) for s in unique))
+        return dict(zip(unique, prices))
+
+    # ===========================================================
+    # 국내 잔고 / 보유 종목 조회 (async)
+    # ===========================================================
+    async def _inquire_balance_async(self):
+        headers = await self._build_headers_async(self._balance_tr_id())
+        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/inquire-balance"
+
+        r = await self._client.get(url, headers=headers, params=self._balance_params())
+        try:
+            r.raise_for_status()
+        except Exception:
+            logger.warning("[국내 잔고 조회 오류] %s", r.text)
+            return None
+
+        return loads_response(r.content)
+
+    async def get_balance_async(self):
+        data = await self._inquire_balance_async()
+        if data is None:
+            return None
+        return self._parse_balance(data)
+
+    async def get_positions_async(self):
+        data = await self._inquire_balance_async()
+        if data is None:
+            return []
+        return self._parse_positions(data)
+
+    # ===========================================================
+    # 세션 정리
+    # ===========================================================
+    async def aclose(self):
+        await self._client.aclose()
+        self.close()
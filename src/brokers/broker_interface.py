@@ -4,6 +4,9 @@ from typing import Any, Dict, List
 
 
 class BrokerInterface(ABC):
+    # buy/sell 이 항상 OrderResult 를 반환하면 True (OrderExecutor 변환 생략)
+    returns_order_result: bool = False
+
     @abstractmethod
     def buy(self, symbol: str, qty: int, **kwargs) -> Dict[str, Any]:
         ...
@@ -16,6 +19,10 @@ class BrokerInterface(ABC):
     def get_price(self, symbol: str) -> float:
         ...
 
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        # 기본 구현: 순차 조회 (브로커별로 병렬/배치 구현으로 override)
+        return {symbol: self.get_price(symbol) for symbol in symbols}
+
     @abstractmethod
     def get_positions(self) -> List[Dict[str, Any]]:
         ...
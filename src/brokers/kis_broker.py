@@ -2,145 +2,393 @@
 # 한국투자증권 OpenAPI(REST) 브로커 구현
 # REAL/VTS 완전 분리, Token 캐싱, Content-Type 정책, 잔고/보유종목 구조 자동 보정
 
-import os
 import time
 import json
+import socket
+import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
 import requests
-import pathlib
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # 선택 의존성: 있으면 응답 JSON 디코딩에 사용
+except ImportError:
+    orjson = None
 
 from brokers.broker_interface import BrokerInterface  # 경로 고정
+from core.settings import ROOT, settings
+
+logger = logging.getLogger(__name__)
 
 # ===============================================================
-# 1) 프로젝트 루트에서 .env 강제 로드
+# 1) .env 는 core.settings import 시 1회 로드 (프로젝트 루트 기준)
 # ===============================================================
-ROOT = pathlib.Path(__file__).resolve().parents[2]
-ENV_PATH = ROOT / ".env"
-load_dotenv(ENV_PATH)
 
 # ===============================================================
 # 2) Token 캐시 파일 정의
 # ===============================================================
-TOKEN_CACHE_FILE = ROOT / "cache/kis_token.json"
-token_lock = threading.Lock()
+# REAL / VTS 는 도메인·앱키가 달라 토큰 호환 안 됨 → 모드별 파일 분리
+TOKEN_CACHE_DIR = ROOT / "cache"
+
 
+def token_cache_file(mode: str) -> Path:
+    return TOKEN_CACHE_DIR / f"kis_token_{mode.upper()}.json"
 
-def get_cached_token():
-    """캐시 파일에서 토큰 로드"""
-    if TOKEN_CACHE_FILE.exists():
+
+token_lock = threading.Lock()
+
+# ===============================================================
+# 3) HTTP 세션 (keep-alive + 커넥션 풀)
+# ===============================================================
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+PRICE_FETCH_WORKERS = 8
+MAX_BALANCE_PAGES = 20
+TOKEN_WAIT_TIMEOUT = 5.0
+
+
+def create_session(pin_dns: bool = False) -> requests.Session:
+    """
+    KIS REST 호출용 Session 생성
+    - keep-alive 로 매 호출마다 TCP/TLS 핸드셰이크 제거
+    - 5xx 응답은 짧은 backoff 로 재시도 (POST 주문은 urllib3 기본값상 재시도 안 함)
+    - pin_dns=True: 이 세션의 새 커넥션만 DNS 해석 결과 재사용 (PinnedDNSAdapter)
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[500, 502, 503, 504],
+    )
+    adapter_kwargs = dict(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    if pin_dns:
+        adapter = PinnedDNSAdapter(PinnedResolver(), **adapter_kwargs)
+    else:
+        adapter = HTTPAdapter(**adapter_kwargs)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_cached_token(mode: str):
+    """모드별 캐시 파일에서 토큰 로드"""
+    path = token_cache_file(mode)
+    if path.exists():
         try:
-            with open(TOKEN_CACHE_FILE, "r", encoding="utf-8") as f:
+            with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
         except:
             return None
     return None
 
 
-def save_cached_token(token_data):
-    """토큰 캐시 저장"""
-    TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(TOKEN_CACHE_FILE, "w", encoding="utf-8") as f:
+def loads_response(content: bytes):
+    """응답 본문(bytes) 직접 디코딩 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_body(obj) -> bytes:
+    """요청 본문 직렬화 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def save_cached_token(mode: str, token_data):
+    """모드별 토큰 캐시 저장"""
+    path = token_cache_file(mode)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
         json.dump(token_data, f)
 
 
 # ===============================================================
-# 3) KISBroker 본체
+# 4) DNS 고정 (KIS 세션 전용, TTL 만료 / 연결 실패 시 재해석)
+# ===============================================================
+DNS_PIN_TTL_SEC = 300.0
+
+
+class PinnedResolver:
+    """
+    (host, port) → IP 캐시.
+    - 고정 세션의 새 커넥션 생성 시에만 사용 (socket.getaddrinfo 전역 교체 없음)
+    - TTL 만료 또는 연결 실패 시 다음 연결에서 재해석 (KIS 측 DNS failover 반영)
+    """
+
+    def __init__(self, ttl: float = DNS_PIN_TTL_SEC):
+        self.ttl = ttl
+        self._cache = {}  # (host, port) -> (ip, expires_at[monotonic])
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> str:
+        key = (host, port)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            # 해석 실패 시 고정하지 않고 호스트명 그대로 연결 (urllib3 기본 오류 처리)
+            return host
+
+        ip = infos[0][4][0]
+        with self._lock:
+            self._cache[key] = (ip, time.monotonic() + self.ttl)
+        return ip
+
+    def invalidate(self, host: str, port: int) -> None:
+        with self._lock:
+            self._cache.pop((host, port), None)
+
+
+def _pinned_connection_cls(base, resolver: PinnedResolver):
+    class PinnedConnection(base):
+        def _new_conn(self):
+            # TCP 연결 대상만 고정 IP, SNI / 인증서 검증은 self.host(호스트명) 기준 유지
+            host = self.host
+            self._dns_host = resolver.resolve(host, self.port)
+            try:
+                return super()._new_conn()
+            except Exception:
+                resolver.invalidate(host, self.port)
+                raise
+
+    PinnedConnection.__name__ = f"Pinned{base.__name__}"
+    return PinnedConnection
+
+
+class PinnedDNSAdapter(HTTPAdapter):
+    """
+    마운트된 세션의 커넥션 풀에만 PinnedResolver 적용하는 HTTPAdapter
+    """
+
+    def __init__(self, resolver: PinnedResolver, **kwargs):
+        # HTTPAdapter.__init__ 이 init_poolmanager 를 호출하므로 먼저 설정
+        self.resolver = resolver
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        resolver = self.resolver
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("PinnedHTTPConnectionPool", (HTTPConnectionPool,), {
+                "ConnectionCls": _pinned_connection_cls(HTTPConnection, resolver),
+            }),
+            "https": type("PinnedHTTPSConnectionPool", (HTTPSConnectionPool,), {
+                "ConnectionCls": _pinned_connection_cls(HTTPSConnection, resolver),
+            }),
+        }
+
+
+# ===============================================================
+# 5) KISBroker 본체
 # ===============================================================
 class KISBroker(BrokerInterface):
 
-    def __init__(self):
+    def __init__(self, mode: str | None = None):
         """
         한국투자증권 REST 브로커 초기화
         - REAL/VTS 완전 분리
         - BASE_URL 분리
         - 실전주문 보호
+        - mode 미지정 시 .env 의 KIS_MODE 사용
         """
         # 운영모드: REAL / VTS
-        self.mode = os.getenv("KIS_MODE", "VTS").upper()
-        self.enable_real_order = os.getenv("ENABLE_REAL_ORDER", "N").upper() == "Y"
+        self.mode = (mode or settings.kis_mode).upper()
+        self.enable_real_order = settings.enable_real_order
 
-        # REAL_ / VTS_ prefix
-        prefix = "REAL_" if self.mode == "REAL" else "VTS_"
+        # REAL_ / VTS_ 계좌 정보
+        account = settings.kis_account(self.mode)
 
-        self.app_key = os.getenv(f"{prefix}APP_KEY")
-        self.app_secret = os.getenv(f"{prefix}APP_SECRET")
-        self.account_no = os.getenv(f"{prefix}ACCOUNT_NO")
-        self.acnt_prdt_cd = os.getenv(f"{prefix}ACNT_PRDT_CD", "01")
+        self.app_key = account.app_key
+        self.app_secret = account.app_secret
+        self.account_no = account.account_no
+        self.acnt_prdt_cd = account.acnt_prdt_cd
 
         # BASE_URL 분리
-        vts_url = os.getenv("VTS_BASE_URL", "").strip()
-        real_url = os.getenv("REAL_BASE_URL", "").strip()
+        self.base_url = account.base_url
+        self.TOKEN_URL = f"{account.base_url}/oauth2/tokenP"
+
+        # 토큰 발급 본문 (키 고정 → 1회 직렬화)
+        self._token_payload = dumps_body({
+            "grant_type": "client_credentials",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret
+        })
+
+        # 주문 상수 (모드/계좌 기준 1회 확정)
+        self._order_url = f"{self.base_url}/uapi/domestic-stock/v1/trading/order-cash"
+        self._buy_tr_id = "VTTC0802U" if self.mode == "VTS" else "TTTC0802U"
+        self._sell_tr_id = "VTTC0801U" if self.mode == "VTS" else "TTTC0801U"
+        self._order_body_template = {
+            "CANO": self.account_no,
+            "ACNT_PRDT_CD": self.acnt_prdt_cd,
+        }
 
-        if self.mode == "REAL":
-            self.base_url = real_url
-            self.TOKEN_URL = f"{real_url}/oauth2/tokenP"
-        else:
-            self.base_url = vts_url
-            self.TOKEN_URL = f"{vts_url}/oauth2/tokenP"
+        # 요청 헤더 템플릿 (토큰 갱신 시에만 재생성)
+        self.custtype = "N" if self.mode == "VTS" else "P"
+        self._get_headers = {}
+        self._post_headers = {}
 
-        # 메모리 캐시
+        # 메모리 캐시 (파일 캐시는 생성 시 1회만 읽음)
         self.access_token = None
         self.token_expiry = 0
+        self._refreshing = None  # 발급 진행 중 Event (single-flight)
+        self._load_token_from_file()
+
+        # 현재가 단기 캐시: symbol -> (price, expires_at[monotonic])
+        self.price_cache_ttl = settings.price_cache_ttl_ms / 1000.0
+        self._price_cache = {}
+        self._price_cache_lock = threading.Lock()
+
+        # 잔고조회 응답 단기 캐시: (data, expires_at[monotonic])
+        self.balance_cache_ttl = settings.balance_cache_ttl_ms / 1000.0
+        self._balance_snapshot_cache = None
+
+        # 공용 HTTP 세션 (appKey/appSecret 은 세션 기본 헤더로 1회 설정)
+        # KIS_PIN_DNS=Y 면 이 세션에 한해 KIS 호스트 DNS 해석 결과 재사용
+        self.session = create_session(pin_dns=settings.kis_pin_dns)
+        self.session.headers.update({
+            "appKey": self.app_key or "",
+            "appSecret": self.app_secret or "",
+        })
 
         # === 디버그 출력 ===
-        print("\n[DEBUG ENV CHECK]")
-        print("MODE =", self.mode)
-        print("app_key =", self.app_key)
-        print("app_secret =", self.app_secret[:15] + "...(hidden)")
-        print("account_no =", self.account_no)
-        print("TOKEN_URL =", self.TOKEN_URL)
-        print("base_url =", self.base_url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[DEBUG ENV CHECK] MODE=%s app_key=%s app_secret=%s...(hidden) "
+                "account_no=%s TOKEN_URL=%s base_url=%s",
+                self.mode, self.app_key, (self.app_secret or "")[:15],
+                self.account_no, self.TOKEN_URL, self.base_url,
+            )
 
         if self.mode == "REAL":
-            print("[KISBroker] ENABLE_REAL_ORDER =", self.enable_real_order)
+            logger.info("[KISBroker] ENABLE_REAL_ORDER = %s", self.enable_real_order)
+
+        # 커넥션 warm-up (KIS_WARMUP=Y 일 때만, 장시간 실행 프로세스용)
+        if settings.kis_warmup and self.base_url:
+            self._start_warm_up()
 
     # ===========================================================
-    # Token 발급 + 캐싱
+    # 커넥션 warm-up
     # ===========================================================
-    def get_token(self):
-        """한국투자증권 토큰 발급 + 캐싱"""
-        with token_lock:
-            now = time.time()
-
-            # 1) 파일 캐시 우선
-            cached = get_cached_token()
-            if cached:
-                token = cached.get("access_token")
-                expiry = cached.get("expiry", 0)
-                if token and now < expiry - 60:
-                    self.access_token = token
-                    self.token_expiry = expiry
-                    return token
-
-            # 2) 메모리 캐시
-            if self.access_token and now < self.token_expiry - 60:
-                return self.access_token
-
-            # 3) 새 토큰 발급
-            headers = {"Content-Type": "application/json; charset=utf-8"}
-            body = {
-                "grant_type": "client_credentials",
-                "appkey": self.app_key,
-                "appsecret": self.app_secret
-            }
+    def _start_warm_up(self):
+        """
+        TCP/TLS 핸드셰이크를 생성 시점에 백그라운드로 미리 수행.
+        HEAD 요청과 토큰 preflight 를 동시에 실행 → 첫 조회가 풀의 연결을 재사용.
+        파일 캐시에서 유효 토큰을 읽은 경우 토큰 preflight 는 생략.
+        """
+        targets = [("head", self._warm_up_head)]
+        if not self._token_valid():
+            targets.append(("token", self._warm_up_token))
+        for name, target in targets:
+            threading.Thread(target=target, name=f"KISBroker-warmup-{name}", daemon=True).start()
 
-            res = requests.post(self.TOKEN_URL, headers=headers, json=body)
-            res.raise_for_status()
+    def _warm_up_head(self):
+        try:
+            self.session.head(self.base_url, timeout=2.0)
+        except Exception as e:
+            logger.debug("[KISBroker] warm-up HEAD 실패: %s", e)
 
-            data = res.json()
-            token = data["access_token"]
-            expiry = now + 3500  # 약 1시간
+    def _warm_up_token(self):
+        try:
+            self.get_token()
+        except Exception as e:
+            logger.debug("[KISBroker] warm-up token 실패: %s", e)
 
-            self.access_token = token
-            self.token_expiry = expiry
+    # ===========================================================
+    # Token 발급 + 캐싱
+    # ===========================================================
+    def _load_token_from_file(self):
+        """파일 캐시에 유효한 토큰이 있으면 메모리 캐시로 적재"""
+        cached = get_cached_token(self.mode)
+        if not cached:
+            return
+        token = cached.get("access_token")
+        expiry = cached.get("expiry", 0)
+        if token and time.time() < expiry - 60:
+            self._set_token(token, expiry)
+
+    def _set_token(self, token, expiry):
+        """메모리 캐시 + 헤더 템플릿 갱신"""
+        base = {
+            "authorization": f"Bearer {token}",
+            "custtype": self.custtype,
+        }
+        self._get_headers = base
+        self._post_headers = {**base, "Content-Type": "application/json; charset=utf-8"}
+        self.access_token = token
+        self.token_expiry = expiry
 
-            print("\n[DEBUG] NEW ACCESS TOKEN ISSUED:")
-            print(token)
-            print("--------------------------------------------------")
+    def _token_valid(self) -> bool:
+        return bool(self.access_token) and time.time() < self.token_expiry - 60
 
-            save_cached_token({"access_token": token, "expiry": expiry})
-            return token
+    def get_token(self):
+        """
+        한국투자증권 토큰 발급 + 캐싱 (single-flight)
+        - 유효 토큰은 lock 없이 반환
+        - 만료 시 한 스레드만 발급, 나머지는 Event 로 완료 대기
+        """
+        # 1) 메모리 캐시 (fast path: lock 없이 반환)
+        if self._token_valid():
+            return self.access_token
+
+        while True:
+            with token_lock:
+                # 2) lock 획득 후 재확인 (다른 스레드가 이미 갱신했을 수 있음)
+                if self._token_valid():
+                    return self.access_token
+
+                refreshing = self._refreshing
+                leader = refreshing is None
+                if leader:
+                    refreshing = self._refreshing = threading.Event()
+
+            if not leader:
+                # 발급 중인 스레드 완료 대기 (실패/타임아웃이면 재시도)
+                refreshing.wait(timeout=TOKEN_WAIT_TIMEOUT)
+                if self._token_valid():
+                    return self.access_token
+                continue
+
+            # 3) 새 토큰 발급 (lock 밖에서 네트워크 호출)
+            try:
+                return self._issue_token()
+            finally:
+                with token_lock:
+                    self._refreshing = None
+                refreshing.set()
+
+    def _issue_token(self):
+        now = time.time()
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        res = self.session.post(self.TOKEN_URL, headers=headers, data=self._token_payload)
+        res.raise_for_status()
+
+        data = loads_response(res.content)
+        token = data["access_token"]
+        expiry = now + 3500  # 약 1시간
+
+        self._set_token(token, expiry)
+
+        logger.debug("[KISBroker] NEW ACCESS TOKEN ISSUED: %s...", token[:10])
+
+        save_cached_token(self.mode, {"access_token": token, "expiry": expiry})
+        return token
 
     # ===========================================================
     # 공통 헤더 생성
@@ -149,26 +397,58 @@ class KISBroker(BrokerInterface):
         """
         GET → Content-Type 없음
         POST → Content-Type 필수
+        (appKey / appSecret 은 세션 기본 헤더로 전송)
         """
-        token = self.get_token()
-
-        headers = {
-            "authorization": f"Bearer {token}",
-            "appKey": self.app_key,
-            "appSecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "N" if self.mode == "VTS" else "P",
-        }
-
-        if include_content_type:
-            headers["Content-Type"] = "application/json; charset=utf-8"
+        self.get_token()
 
+        template = self._post_headers if include_content_type else self._get_headers
+        headers = template.copy()
+        headers["tr_id"] = tr_id
         return headers
 
     # ===========================================================
     # 국내 현재가 조회
     # ===========================================================
     def get_price(self, symbol: str) -> float:
+        return self._get_price_one(symbol)
+
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        여러 종목 현재가 동시 조회
+        - 공용 세션 커넥션 풀(POOL_MAXSIZE)을 스레드 간 재사용
+        - 개별 실패 종목은 0.0
+        """
+        unique = list(dict.fromkeys(symbols))
+        if len(unique) <= 1:
+            return {symbol: self._get_price_one(symbol) for symbol in unique}
+
+        # 토큰은 병렬 요청 전에 1회 확보 (스레드별 중복 발급 방지)
+        self.get_token()
+
+        workers = min(PRICE_FETCH_WORKERS, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            prices = pool.map(self._get_price_one, unique)
+            return dict(zip(unique, prices))
+
+    def _get_price_one(self, symbol: str) -> float:
+        """TTL 캐시 우선 조회 (같은 틱 내 중복 REST 호출 제거)"""
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        price = self._fetch_price(symbol)
+
+        # 조회 실패(0.0)는 캐시하지 않음
+        if price > 0 and self.price_cache_ttl > 0:
+            with self._price_cache_lock:
+                self._price_cache[symbol] = (price, time.monotonic() + self.price_cache_ttl)
+        return price
+
+    def _invalidate_price(self, symbol: str) -> None:
+        with self._price_cache_lock:
+            self._price_cache.pop(symbol, None)
+
+    def _fetch_price(self, symbol: str) -> float:
         headers = self._build_headers("FHKST01010100", include_content_type=False)
         url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
 
@@ -177,31 +457,24 @@ class KISBroker(BrokerInterface):
             "FID_INPUT_ISCD": symbol
         }
 
-        r = requests.get(url, headers=headers, params=params)
+        r = self.session.get(url, headers=headers, params=params)
         try:
             r.raise_for_status()
         except Exception:
-            print("\n[국내 시세 조회 오류]", symbol)
-            print("RESPONSE:", r.text)
+            logger.warning("[국내 시세 조회 오류] %s RESPONSE: %s", symbol, r.text)
             return 0.0
 
-        return float(r.json()["output"]["stck_prpr"])
+        return float(loads_response(r.content)["output"]["stck_prpr"])
 
     # ===========================================================
-    # 국내 잔고 조회
+    # 잔고조회(inquire-balance) 공통 요청/파싱
     # ===========================================================
-    def get_balance(self):
-        """
-        REAL: TTTC8434R
-        VTS : VTTC2472R
-        ※ output2 구조가 dict 또는 list 로 내려오므로 자동 보정 필요
-        """
-        tr_id = "VTTC2472R" if self.mode == "VTS" else "TTTC8434R"
-        headers = self._build_headers(tr_id, include_content_type=False)
-
-        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/inquire-balance"
+    def _balance_tr_id(self) -> str:
+        """REAL: TTTC8434R / VTS : VTTC2472R"""
+        return "VTTC2472R" if self.mode == "VTS" else "TTTC8434R"
 
-        params = {
+    def _balance_params(self) -> dict:
+        return {
             "CANO": self.account_no,
             "ACNT_PRDT_CD": self.acnt_prdt_cd,
             "AFHR_FLPR_YN": "N",
@@ -215,17 +488,11 @@ class KISBroker(BrokerInterface):
             "CTX_AREA_NK100": "",
         }
 
-        r = requests.get(url, headers=headers, params=params)
-        try:
-            r.raise_for_status()
-        except Exception:
-            print("\n[국내 잔고 조회 오류]", r.text)
-            return None
-
-        data = r.json()
+    @staticmethod
+    def _parse_balance(data: dict) -> dict:
+        """※ output2 구조가 dict 또는 list 로 내려오므로 자동 보정"""
         out_raw = data.get("output2", {})
 
-        # output2 구조 자동 보정
         if isinstance(out_raw, list):
             out = out_raw[0] if len(out_raw) > 0 else {}
         elif isinstance(out_raw, dict):
@@ -239,44 +506,11 @@ class KISBroker(BrokerInterface):
             "pnl_total": float(out.get("evlu_pfls_smtl_amt", 0)),
         }
 
-    # ===========================================================
-    # 국내 보유 종목 조회
-    # ===========================================================
-    def get_positions(self):
-        """
-        한국투자증권 공식 권장 방식:
-        보유 종목 = 잔고조회(inquire-balance) 의 output1 을 사용
-        """
-        tr_id = "VTTC2472R" if self.mode == "VTS" else "TTTC8434R"
-        headers = self._build_headers(tr_id, include_content_type=False)
-
-        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/inquire-balance"
-
-        params = {
-            "CANO": self.account_no,
-            "ACNT_PRDT_CD": self.acnt_prdt_cd,
-            "AFHR_FLPR_YN": "N",
-            "OFL_YN": "",
-            "INQR_DVSN": "01",
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "00",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": ""
-        }
-
-        r = requests.get(url, headers=headers, params=params)
-        try:
-            r.raise_for_status()
-        except:
-            print("\n[국내 보유 종목 조회 오류]", r.text)
-            return []
-
-        data = r.json()
+    @staticmethod
+    def _parse_positions(data: dict) -> list:
+        """※ output1 구조가 dict 또는 list 로 내려오므로 자동 보정"""
         out_raw = data.get("output1", [])
 
-        # output1 형식 보정
         if isinstance(out_raw, dict):
             out_list = [out_raw]
         elif isinstance(out_raw, list):
@@ -296,69 +530,164 @@ class KISBroker(BrokerInterface):
 
         return positions
 
+    def _inquire_balance(self):
+        """
+        잔고조회 연속조회(CTX_AREA_FK100/NK100)까지 모두 받아
+        output1(보유종목 전체) + output2(잔고) 스냅샷 1개로 반환.
+        get_balance / get_positions 가 같은 스냅샷을 공유하도록 짧게 캐시.
+        """
+        cached = self._balance_snapshot_cache
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        headers = self._build_headers(self._balance_tr_id(), include_content_type=False)
+        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/inquire-balance"
+        params = self._balance_params()
+
+        rows = []
+        output2 = {}
+        for page in range(MAX_BALANCE_PAGES):
+            r = self.session.get(url, headers=headers, params=params)
+            try:
+                r.raise_for_status()
+            except Exception:
+                logger.warning("[국내 잔고 조회 오류] %s", r.text)
+                return None
+
+            data = loads_response(r.content)
+
+            out1 = data.get("output1", [])
+            if isinstance(out1, dict):
+                rows.append(out1)
+            elif isinstance(out1, list):
+                rows.extend(out1)
+
+            if page == 0:
+                output2 = data.get("output2", {})
+
+            # 응답 헤더 tr_cont: M/F = 다음 페이지 있음, D/E = 마지막
+            if r.headers.get("tr_cont", "") not in ("M", "F"):
+                break
+
+            headers = {**headers, "tr_cont": "N"}
+            params = {
+                **params,
+                "CTX_AREA_FK100": data.get("ctx_area_fk100", ""),
+                "CTX_AREA_NK100": data.get("ctx_area_nk100", ""),
+            }
+
+        snapshot = {"output1": rows, "output2": output2}
+        self._balance_snapshot_cache = (snapshot, time.monotonic() + self.balance_cache_ttl)
+        return snapshot
+
     # ===========================================================
-    # 국내 매수 (POST)
+    # 국내 잔고 조회
     # ===========================================================
-    def buy(self, symbol: str, qty: int, price: float = 0.0, order_type="03"):
-        tr_id = "VTTC0802U" if self.mode == "VTS" else "TTTC0802U"
-        headers = self._build_headers(tr_id, include_content_type=True)
+    def get_balance(self):
+        data = self._inquire_balance()
+        if data is None:
+            return None
+        return self._parse_balance(data)
+
+    # ===========================================================
+    # 국내 보유 종목 조회
+    # ===========================================================
+    def get_positions(self):
+        """
+        한국투자증권 공식 권장 방식:
+        보유 종목 = 잔고조회(inquire-balance) 의 output1 을 사용
+        """
+        data = self._inquire_balance()
+        if data is None:
+            return []
+        return self._parse_positions(data)
 
-        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/order-cash"
+    # ===========================================================
+    # 잔고 + 보유 종목 (단일 호출)
+    # ===========================================================
+    def get_account_snapshot(self):
+        data = self._inquire_balance()
+        if data is None:
+            return {"balance": None, "positions": []}
+        return {
+            "balance": self._parse_balance(data),
+            "positions": self._parse_positions(data),
+        }
 
-        body = {
-            "CANO": self.account_no,
-            "ACNT_PRDT_CD": self.acnt_prdt_cd,
+    # ===========================================================
+    # 주문 본문 생성
+    # ===========================================================
+    def _order_body(self, symbol: str, qty: int, price: float, order_type: str) -> dict:
+        """ORD_DVSN 00(지정가)만 단가 전송, 그 외(시장가 등)는 "0" """
+        return {
+            **self._order_body_template,
             "PDNO": symbol,
             "ORD_DVSN": order_type,
             "ORD_QTY": str(qty),
-            "ORD_UNPR": str(price if order_type == "00" else "0"),
+            "ORD_UNPR": str(price) if order_type == "00" else "0",
         }
 
+    # ===========================================================
+    # 국내 매수 (POST)
+    # ===========================================================
+    def buy(self, symbol: str, qty: int, price: float = 0.0, order_type="03"):
+        headers = self._build_headers(self._buy_tr_id, include_content_type=True)
+        body = self._order_body(symbol, qty, price, order_type)
+
         # 실전주문 보호
         if self.mode == "REAL" and not self.enable_real_order:
-            print("\n[REAL BUY SIMULATION] (실제 주문 전송 없음)")
-            print("BODY:", body)
+            logger.info("[REAL BUY SIMULATION] (실제 주문 전송 없음) BODY: %s", body)
             return {"status": "SIMULATED", "body": body}
 
-        r = requests.post(url, headers=headers, json=body)
+        self._invalidate_price(symbol)
+        self._balance_snapshot_cache = None
+
+        r = self.session.post(self._order_url, headers=headers, data=dumps_body(body))
         try:
             r.raise_for_status()
         except Exception:
-            print("\n[국내 매수 주문 오류]", r.text)
+            logger.warning("[국내 매수 주문 오류] %s", r.text)
             return None
 
-        print("\n[국내 매수 주문 성공]")
+        logger.info("[국내 매수 주문 성공] %s", symbol)
         return r.json()
 
     # ===========================================================
     # 국내 매도 (POST)
     # ===========================================================
     def sell(self, symbol: str, qty: int, price: float = 0.0, order_type="03"):
-        tr_id = "VTTC0801U" if self.mode == "VTS" else "TTTC0801U"
-        headers = self._build_headers(tr_id, include_content_type=True)
-
-        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/order-cash"
-
-        body = {
-            "CANO": self.account_no,
-            "ACNT_PRDT_CD": self.acnt_prdt_cd,
-            "PDNO": symbol,
-            "ORD_DVSN": order_type,
-            "ORD_QTY": str(qty),
-            "ORD_UNPR": str(price if order_type == "00" else "0"),
-        }
+        headers = self._build_headers(self._sell_tr_id, include_content_type=True)
+        body = self._order_body(symbol, qty, price, order_type)
 
         if self.mode == "REAL" and not self.enable_real_order:
-            print("\n[REAL SELL SIMULATION] (실제 주문 전송 없음)")
-            print("BODY:", body)
+            logger.info("[REAL SELL SIMULATION] (실제 주문 전송 없음) BODY: %s", body)
             return {"status": "SIMULATED", "body": body}
 
-        r = requests.post(url, headers=headers, json=body)
+        self._invalidate_price(symbol)
+        self._balance_snapshot_cache = None
+
+        r = self.session.post(self._order_url, headers=headers, data=dumps_body(body))
         try:
             r.raise_for_status()
         except Exception:
-            print("\n[국내 매도 주문 오류]", r.text)
+            logger.warning("[국내 매도 주문 오류] %s", r.text)
             return None
 
-        print("\n[국내 매도 주문 성공]")
+        logger.info("[국내 매도 주문 성공] %s", symbol)
         return r.json()
+
+    # ===========================================================
+    # 세션 정리
+    # ===========================================================
+    def close(self):
+        """커넥션 풀 반환"""
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
+            self.session = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,169 @@
+# src/brokers/kis_websocket_feed.py
+# 한국투자증권 실시간 체결가(H0STCNT0) WebSocket 시세 피드
+# REST 폴링 대신 push 시세를 받아 종목별 최종 체결가를 메모리에 유지
+
+import json
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+
+try:
+    import websocket  # 선택 의존성: websocket-client
+except ImportError:
+    websocket = None
+
+from brokers.kis_broker import KISBroker, loads_response
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 실시간 주식 체결가 TR
+TR_ID_REALTIME_PRICE = "H0STCNT0"
+
+# H0STCNT0 레코드 필드 수 / 필드 위치 (^ 구분)
+H0STCNT0_FIELD_COUNT = 46
+FIELD_SYMBOL = 0        # MKSC_SHRN_ISCD
+FIELD_PRICE = 2         # STCK_PRPR
+
+DEFAULT_WS_URL = {
+    "REAL": "ws://ops.koreainvestment.com:21000",
+    "VTS": "ws://ops.koreainvestment.com:31000",
+}
+
+
+class KISWebsocketPriceFeed:
+    """
+    KIS WebSocket 실시간 시세 피드
+    - start(symbols): approval_key 발급 → 구독 → 백그라운드 스레드에서 수신
+    - get_price(symbol): 최근 체결가 (없으면 None → 호출측에서 REST fallback)
+    """
+
+    def __init__(self, broker: KISBroker):
+        if websocket is None:
+            raise ImportError("KISWebsocketPriceFeed requires 'websocket-client' (pip install websocket-client)")
+
+        self.broker = broker
+        self.ws_url = settings.kis_account(broker.mode).ws_url or DEFAULT_WS_URL.get(broker.mode, "")
+
+        self._last_price: Dict[str, float] = {}
+        self._symbols: list = []
+        self._approval_key: Optional[str] = None
+        self._ws = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ===========================================================
+    # 접속키(approval_key) 발급
+    # ===========================================================
+    def _issue_approval_key(self) -> str:
+        url = f"{self.broker.base_url}/oauth2/Approval"
+        body = {
+            "grant_type": "client_credentials",
+            "appkey": self.broker.app_key,
+            "secretkey": self.broker.app_secret,
+        }
+        r = self.broker.session.post(
+            url,
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            json=body,
+        )
+        r.raise_for_status()
+        return loads_response(r.content)["approval_key"]
+
+    def _subscribe_message(self, symbol: str, tr_type: str = "1") -> str:
+        """tr_type: 1=등록, 2=해제"""
+        return json.dumps({
+            "header": {
+                "approval_key": self._approval_key,
+                "custtype": self.broker.custtype,
+                "tr_type": tr_type,
+                "content-type": "utf-8",
+            },
+            "body": {
+                "input": {
+                    "tr_id": TR_ID_REALTIME_PRICE,
+                    "tr_key": symbol,
+                }
+            },
+        })
+
+    # ===========================================================
+    # 시작 / 종료
+    # ===========================================================
+    def start(self, symbols: Iterable[str]) -> None:
+        self._symbols = list(dict.fromkeys(symbols))
+        if self._approval_key is None:
+            self._approval_key = self._issue_approval_key()
+
+        self._ws = websocket.WebSocketApp(
+            self.ws_url,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_error=self._on_error,
+        )
+        self._thread = threading.Thread(
+            target=self._ws.run_forever,
+            name="KISWebsocketPriceFeed",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._ws is not None:
+            self._ws.close()
+            self._ws = None
+        self._thread = None
+
+    # ===========================================================
+    # 조회
+    # ===========================================================
+    def get_price(self, symbol: str) -> Optional[float]:
+        return self._last_price.get(symbol)
+
+    # ===========================================================
+    # WebSocket 콜백
+    # ===========================================================
+    def _on_open(self, ws) -> None:
+        for symbol in self._symbols:
+            ws.send(self._subscribe_message(symbol))
+
+    def _on_error(self, ws, error) -> None:
+        logger.warning("[실시간 시세 WebSocket 오류] %s", error)
+
+    def _on_message(self, ws, message: str) -> None:
+        # 실시간 데이터: "0|H0STCNT0|003|레코드^레코드^..." (1 = 암호화 TR, 체결가는 평문)
+        if message[:1] == "0":
+            self._handle_realtime(message)
+            return
+        if message[:1] == "1":
+            return
+
+        # 제어 메시지(JSON): PINGPONG 은 그대로 회신
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+
+        if data.get("header", {}).get("tr_id") == "PINGPONG":
+            ws.send(message)
+
+    def _handle_realtime(self, message: str) -> None:
+        parts = message.split("|", 3)
+        if len(parts) < 4 or parts[1] != TR_ID_REALTIME_PRICE:
+            return
+
+        try:
+            count = int(parts[2])
+        except ValueError:
+            return
+
+        fields = parts[3].split("^")
+        last_price = self._last_price
+        for i in range(count):
+            base = i * H0STCNT0_FIELD_COUNT
+            if base + FIELD_PRICE >= len(fields):
+                break
+            try:
+                # dict 단일 대입은 GIL 하에서 원자적 → 읽기측 lock 불필요
+                last_price[fields[base + FIELD_SYMBOL]] = float(fields[base + FIELD_PRICE])
+            except ValueError:
+                continue
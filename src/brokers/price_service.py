@@ -1,5 +1,8 @@
 # src/brokers/price_service.py
 
+from functools import partial
+from typing import Callable, Dict, Iterable, Tuple
+
 from brokers.kis_broker import KISBroker
 
 
@@ -7,8 +10,19 @@ class PriceService:
     """
     KR / US / HK 해외 현재가 통합 조회 서비스
     """
-    def __init__(self, broker: KISBroker):
+    def __init__(self, broker: KISBroker, price_feed=None):
         self.broker = broker
+        # 실시간 시세 피드(KISWebsocketPriceFeed 등). 없거나 미수신 종목은 REST 조회
+        self.price_feed = price_feed
+
+        # 시장 코드 → 조회 함수 (생성 시 1회 구성)
+        kr_fn = self._get_kr_price if price_feed is not None else broker.get_price
+        self._dispatch: Dict[str, Callable[[str], float]] = {"KR": kr_fn}
+
+        overseas_fn = getattr(broker, "get_overseas_price", None)
+        if overseas_fn is not None:
+            for market, exch_code in self.EXCD.items():
+                self._dispatch[market] = partial(overseas_fn, exch_code)
 
     # 시장 코드 매핑
     EXCD = {
@@ -17,20 +31,74 @@ class PriceService:
         "JP": "TSE"
     }
 
+    def _get_kr_price(self, symbol: str) -> float:
+        price = self.price_feed.get_price(symbol)
+        if price is not None:
+            return price
+        return self.broker.get_price(symbol)
+
     def get_live_price(self, symbol: str, market: str) -> float:
-        market = market.upper().strip()
+        """
+        market 은 "KR" / "US" / "HK" / "JP" (정규화된 값이면 dict 조회 1회로 처리).
+        미지원 시장 / 해외 조회 미구현 브로커는 0.0
+        """
+        fn = self._dispatch.get(market)
+        if fn is None:
+            fn = self._dispatch.get(market.upper().strip())
+            if fn is None:
+                return 0.0
+        return fn(symbol)
 
-        # 1) 국내 주식
-        if market == "KR":
-            return self.broker.get_price(symbol)
+    def get_live_prices(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], float]:
+        """
+        (symbol, market) 목록 일괄 조회.
+        국내(KR)는 브로커 배치 조회(get_prices)로 묶고, 나머지는 get_live_price 로 처리.
+        """
+        result: Dict[Tuple[str, str], float] = {}
+        kr_symbols = []
 
-        # 2) 해외 주식
-        if market in ("US", "HK", "JP"):
-            exch_code = self.EXCD.get(market, None)
-            if not exch_code:
-                return 0.0
+        for symbol, market in pairs:
+            market = market.upper().strip()
+            if market == "KR":
+                kr_symbols.append(symbol)
+            else:
+                result[(symbol, market)] = self.get_live_price(symbol, market)
+
+        if kr_symbols and self.price_feed is not None:
+            # 실시간 피드 수신 종목은 피드 가격 사용, 나머지만 REST 배치 조회
+            pending = []
+            for symbol in kr_symbols:
+                price = self.price_feed.get_price(symbol)
+                if price is None:
+                    pending.append(symbol)
+                else:
+                    result[(symbol, "KR")] = price
+            kr_symbols = pending
+
+        if kr_symbols:
+            for symbol, price in self.broker.get_prices(kr_symbols).items():
+                result[(symbol, "KR")] = price
+
+        return result
+
+    async def get_live_prices_async(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], float]:
+        """
+        get_live_prices 의 비동기 버전 (AsyncKISBroker 전용).
+        국내(KR) 종목은 broker.get_prices_async 로 한 번에 gather.
+        """
+        result: Dict[Tuple[str, str], float] = {}
+        kr_symbols = []
+
+        for symbol, market in pairs:
+            market = market.upper().strip()
+            if market == "KR":
+                kr_symbols.append(symbol)
+            else:
+                result[(symbol, market)] = self.get_live_price(symbol, market)
 
-            return self.broker.get_overseas_price(exch_code, symbol)
+        if kr_symbols:
+            prices = await self.broker.get_prices_async(kr_symbols)
+            for symbol, price in prices.items():
+                result[(symbol, "KR")] = price
 
-        # 3) 그 외: 지원하지 않음
-        return 0.0
+        return result
@@ -12,6 +12,9 @@ class VirtualBroker:
     - 실제 API 호출 대신 즉시 체결 처리
     """
 
+    # buy/sell 모두 OrderResult 반환
+    returns_order_result = True
+
     def __init__(self, price_service):
         self.price_service = price_service
 
@@ -1,16 +1,21 @@
 # src/core/app_context.py
 
-import os
+import logging
+from functools import cached_property
 from pathlib import Path
 
 from core.config_loader import load_settings
+from core.settings import settings as env_settings
 from brokers.kis_broker import KISBroker
 
 from sheets.google_client import GoogleSheetsClient
+from sheets.async_sheets_client import AsyncSheetsClient
 from sheets.schema_registry import SchemaRegistry
 from sheets.dt_report_repository import DTReportRepository
 from sheets.position_repository import PositionRepository
 from sheets.history_repository import HistoryRepository
+from sheets.config_repository import ConfigRepository
+from sheets.sheets_facade import SheetsFacade
 
 from engine.portfolio_engine import PortfolioEngine
 
@@ -23,6 +28,8 @@ from engine.trading.trading_engine import TradingEngine
 # 가격 조회 서비스 (broker → price_service)
 from brokers.price_service import PriceService
 
+logger = logging.getLogger(__name__)
+
 
 class AppContext:
     """
@@ -33,6 +40,9 @@ class AppContext:
     - Broker 생성(KIS)
     - PortfolioEngine 생성
     - TradingEngine 생성(신규)
+
+    Broker 이후 구성요소는 cached_property 로 최초 접근 시 1회 생성.
+    (테스트에서 ctx.broker = ... 처럼 대입하면 이후 의존 객체가 대입된 값을 사용)
     """
 
     def __init__(self, root_dir: Path):
@@ -51,10 +61,13 @@ class AppContext:
         # ------------------------------------------------------------
         # 3. Google Sheets 연결
         # ------------------------------------------------------------
-        sheet_key = os.getenv("GOOGLE_SHEET_KEY")
-        cred_file = os.getenv("GOOGLE_CREDENTIALS_FILE")
+        sheet_key = env_settings.google_sheet_key
+        cred_file = env_settings.google_credentials_file
 
-        self.gs = GoogleSheetsClient(sheet_key, cred_file)
+        self.gs = GoogleSheetsClient(
+            credentials_path=cred_file,
+            spreadsheet_id=sheet_key,
+        )
         self.gs.connect()
 
         # ------------------------------------------------------------
@@ -63,83 +76,152 @@ class AppContext:
         schema_path = self.config_dir / "auto_trading_system.schema.json"
         self.schema = SchemaRegistry(schema_path)
 
-        # ------------------------------------------------------------
-        # 5. KIS_MODE 설정 (시트 값 > .env)
-        # ------------------------------------------------------------
-        try:
-            kis_mode_from_sheet = self.gs.read_range("Config", "C92")[0][0].strip().upper()
-        except Exception:
-            kis_mode_from_sheet = None
-
-        if kis_mode_from_sheet in ("VTS", "REAL"):
-            self.kis_mode = kis_mode_from_sheet
-        else:
-            self.kis_mode = os.getenv("KIS_MODE", "VTS").upper()
-
-        print(f"[AppContext] KIS_MODE = {self.kis_mode}")
+        # 블록 셀 주소 / 컬럼 문자 사전 해석 (속성 접근)
+        self.schema_ns = self.schema.freeze()
 
         # ------------------------------------------------------------
-        # 6. Broker 초기화
+        # 5. 시작 시 필요한 셀 일괄 조회 (Config KIS_MODE + Position 초기자본)
+        #    values.batchGet 1회 호출
+        #    프로세스 환경변수로 KIS_MODE 를 명시한 경우 Config 셀은 조회하지 않음 (.env 값은 해당 없음)
         # ------------------------------------------------------------
-        self.broker = KISBroker(mode=self.kis_mode)
+        initial_cash_cell = self.schema_ns.Position.Summary.initial_equity_investment
 
-        # PriceService 생성 (broker 기반)
-        self.price_service = PriceService(self.broker)
+        ranges = [f"Position!{initial_cash_cell}"]
+        if not env_settings.kis_mode_explicit:
+            ranges.append("Config!C92")
 
-        # ------------------------------------------------------------
-        # 7. Repository 초기화
-        # ------------------------------------------------------------
-        self.dt_repo = DTReportRepository(self.schema, self.gs)
-        self.position_repo = PositionRepository(self.schema, self.gs)
-        self.history_repo = HistoryRepository(self.schema, self.gs)
+        try:
+            values = self.gs.batch_read(ranges)
+        except Exception:
+            values = []
+
+        initial_cash_vals = values[0] if len(values) > 0 else []
+        kis_mode_vals = values[1] if len(values) > 1 else []
 
         # ------------------------------------------------------------
-        # 8. Position 시트에서 초기자본 읽기
+        # 6. KIS_MODE 설정 (프로세스 환경변수 명시 > 시트 값 > .env / 기본값 VTS)
         # ------------------------------------------------------------
-        pos_schema = self.schema.get("Position")
-        initial_cash_cell = pos_schema.blocks["Summary"]["initial_equity_investment"]
+        try:
+            kis_mode_from_sheet = kis_mode_vals[0][0].strip().upper()
+        except Exception:
+            kis_mode_from_sheet = None
 
+        if env_settings.kis_mode_explicit:
+            self.kis_mode = env_settings.kis_mode
+        elif kis_mode_from_sheet in ("VTS", "REAL"):
+            self.kis_mode = kis_mode_from_sheet
+        else:
+            self.kis_mode = env_settings.kis_mode
+
+        logger.info("KIS_MODE = %s", self.kis_mode)
+
+        # 초기자본 원본 셀 값 (파싱은 initial_cash 최초 접근 시)
+        self._initial_cash_vals = initial_cash_vals
+
+        # 이후 구성요소(Broker / Repository / Engine)는 최초 접근 시 생성 (cached_property)
+
+    # ================================================================
+    # 7. Broker / PriceService
+    # ================================================================
+    @cached_property
+    def broker(self) -> KISBroker:
+        return KISBroker(mode=self.kis_mode)
+
+    @cached_property
+    def price_service(self) -> PriceService:
+        return PriceService(self.broker)
+
+    # ================================================================
+    # 8. Repository
+    # ================================================================
+    @cached_property
+    def dt_repo(self) -> DTReportRepository:
+        return DTReportRepository(self.schema, self.gs)
+
+    @cached_property
+    def position_repo(self) -> PositionRepository:
+        return PositionRepository(self.schema, self.gs)
+
+    @cached_property
+    def history_repo(self) -> HistoryRepository:
+        return HistoryRepository(self.schema, self.gs)
+
+    @cached_property
+    def config_repo(self) -> ConfigRepository:
+        return ConfigRepository(self.schema, self.gs)
+
+    @cached_property
+    def async_sheets(self) -> AsyncSheetsClient:
+        # 서로 독립적인 시트 조회 동시 실행용 (같은 인증 세션 공유)
+        return AsyncSheetsClient(self.gs)
+
+    @cached_property
+    def sheets(self) -> SheetsFacade:
+        # 여러 시트 동시 조회 시 values.batchGet 1회
+        return SheetsFacade(self.gs, [self.dt_repo, self.position_repo, self.history_repo])
+
+    # ================================================================
+    # 9. 초기자본 (5단계 일괄 조회 결과 파싱)
+    # ================================================================
+    @cached_property
+    def initial_cash(self) -> float:
         try:
-            raw_value = self.gs.read_range("Position", initial_cash_cell)[0][0]
+            raw_value = self._initial_cash_vals[0][0]
             initial_cash = float(str(raw_value).replace(",", "").strip())
         except Exception:
             initial_cash = 0.0
 
-        print(f"[AppContext] Initial_Cash Loaded = {initial_cash}")
+        logger.info("Initial_Cash Loaded = %s", initial_cash)
+        return initial_cash
 
-        # ------------------------------------------------------------
-        # 9. PortfolioEngine 초기화
-        # ------------------------------------------------------------
-        self.portfolio = PortfolioEngine(
+    # ================================================================
+    # 10. PortfolioEngine
+    # ================================================================
+    @cached_property
+    def portfolio(self) -> PortfolioEngine:
+        return PortfolioEngine(
             broker=self.broker,
             position_repo=self.position_repo,
             dt_repo=self.dt_repo,
-            initial_cash=initial_cash,
+            initial_cash=self.initial_cash,
+            price_service=self.price_service,
+            sheets=self.sheets,
         )
 
-        # ============================================================
-        # ★ 10. TradingEngine 구성 요소 생성 (신규 추가)
-        # ============================================================
+    # ================================================================
+    # ★ 11. TradingEngine 구성 요소
+    # ================================================================
 
-        # A) OrderValidator
-        self.order_validator = OrderValidator(
+    # A) OrderValidator
+    @cached_property
+    def order_validator(self) -> OrderValidator:
+        return OrderValidator(
             risk_engine=None,  # RiskEngine 연결 시 여기에 주입
             pos_repo=self.position_repo,
             config=self.settings.get("validator", {})
         )
 
-        # B) PositionSizer
-        self.position_sizer = PositionSizer(
+    # B) PositionSizer
+    @cached_property
+    def position_sizer(self) -> PositionSizer:
+        return PositionSizer(
             price_service=self.price_service,
             history_repo=self.history_repo,
             config=self.settings.get("sizer", {})
         )
 
-        # C) OrderExecutor
-        self.order_executor = OrderExecutor(broker=self.broker)
-
-        # D) TradingEngine 생성
-        self.trading_engine = TradingEngine(
+    # C) OrderExecutor
+    @cached_property
+    def order_executor(self) -> OrderExecutor:
+        executor = OrderExecutor(broker=self.broker)
+        # 주문 체결 시 PortfolioEngine 의 Position 캐시 무효화
+        executor.add_fill_listener(self.portfolio.invalidate_positions)
+        return executor
+
+    # D) TradingEngine
+    @cached_property
+    def trading_engine(self) -> TradingEngine:
+        engine = TradingEngine(
             dt_repo=self.dt_repo,
             pos_repo=self.position_repo,
             hist_repo=self.history_repo,
@@ -147,5 +229,5 @@ class AppContext:
             sizer=self.position_sizer,
             executor=self.order_executor
         )
-
-        print("[AppContext] TradingEngine 초기화 완료")
+        logger.info("TradingEngine 초기화 완료")
+        return engine
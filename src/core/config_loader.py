@@ -1,22 +1,54 @@
 # src/core/config_loader.py
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson  # 선택 의존성: 설치 시 JSON 파싱 가속
+except ImportError:
+    orjson = None
 
-def load_settings(config_dir: Path):
-    settings_path = config_dir / "settings.json"
-    with open(settings_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
 
-    # 환경변수 자동 치환
-    def resolve(value):
-        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-            env_name = value[2:-1]
-            return os.getenv(env_name)
-        return value
+def read_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=8)
+def _read_json_cached(path_str: str, mtime_ns: int):
+    # mtime_ns 는 캐시 키 용도 (파일 수정 시 재파싱)
+    return read_json(Path(path_str))
+
+
+def read_json_cached(path: Path):
+    """
+    같은 프로세스 내 동일 파일 재파싱 방지 (스키마 등 읽기 전용 JSON 용).
+    반환 객체는 공유되므로 호출측에서 수정하지 말 것
+    """
+    return _read_json_cached(str(path), path.stat().st_mtime_ns)
+
 
-    for k, v in data.items():
-        data[k] = resolve(v)
+# 환경변수 자동 치환
+def _resolve(value):
+    if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
+        env_name = value[2:-1]
+        return os.getenv(env_name)
+    return value
+
+
+@lru_cache(maxsize=4)
+def _load_settings_cached(settings_path: str, mtime_ns: int):
+    # mtime_ns 는 캐시 키 용도 (파일 수정 시 재파싱)
+    data = read_json(Path(settings_path))
+    return {k: _resolve(v) for k, v in data.items()}
+
+
+def load_settings(config_dir: Path):
+    settings_path = config_dir / "settings.json"
+    data = _load_settings_cached(str(settings_path), settings_path.stat().st_mtime_ns)
 
-    return data
+    # 호출측 수정이 캐시에 반영되지 않도록 복사본 반환
+    return dict(data)
@@ -0,0 +1,30 @@
+# src/core/log_config.py
+# 로깅 설정: 루트 로거에는 QueueHandler 만 두고, 실제 출력(stdout)은 QueueListener 스레드에서 처리
+# (트레이딩 루프 / 브로커 스레드가 stdout 출력으로 블로킹되지 않도록)
+
+import logging
+import logging.handlers
+import queue
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    루트 로거 구성 후 QueueListener 시작.
+    반환된 listener 는 종료 시 stop() 호출 (남은 로그 flush)
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
@@ -0,0 +1,81 @@
+# src/core/settings.py
+# 프로세스 전역 환경설정: .env 는 이 모듈 import 시 1회만 로드
+# (각 모듈의 load_dotenv / os.getenv 반복 호출 대신 settings 속성 참조)
+
+import os
+import pathlib
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+ENV_PATH = ROOT / ".env"
+
+# .env 로드 전 프로세스 환경변수의 KIS_MODE (실행 시 명시한 override 만 시트 값보다 우선)
+# .env 의 KIS_MODE 는 시트(Config) 값이 없을 때의 기본값
+_PROCESS_KIS_MODE = os.environ.get("KIS_MODE", "")
+
+load_dotenv(ENV_PATH)
+
+
+@dataclass(frozen=True)
+class KISAccount:
+    """REAL_ / VTS_ prefix 별 계좌/접속 정보"""
+    app_key: str | None
+    app_secret: str | None
+    account_no: str | None
+    acnt_prdt_cd: str
+    base_url: str
+    ws_url: str
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "KISAccount":
+        return cls(
+            app_key=os.getenv(f"{prefix}APP_KEY"),
+            app_secret=os.getenv(f"{prefix}APP_SECRET"),
+            account_no=os.getenv(f"{prefix}ACCOUNT_NO"),
+            acnt_prdt_cd=os.getenv(f"{prefix}ACNT_PRDT_CD", "01"),
+            base_url=os.getenv(f"{prefix}BASE_URL", "").strip(),
+            ws_url=os.getenv(f"{prefix}WS_URL", "").strip(),
+        )
+
+
+@dataclass(frozen=True)
+class Settings:
+    kis_mode: str
+    kis_mode_explicit: bool     # 프로세스 환경변수로 KIS_MODE 를 명시했는지 (.env 제외, 시트 값보다 우선)
+    enable_real_order: bool
+    real: KISAccount
+    vts: KISAccount
+
+    # 캐시/네트워크 튜닝
+    price_cache_ttl_ms: float
+    balance_cache_ttl_ms: float
+    kis_pin_dns: bool
+    kis_warmup: bool
+
+    # Google Sheets
+    google_sheet_key: str | None
+    google_credentials_file: str | None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            kis_mode=os.getenv("KIS_MODE", "VTS").strip().upper(),
+            kis_mode_explicit=_PROCESS_KIS_MODE.strip().upper() in ("VTS", "REAL"),
+            enable_real_order=os.getenv("ENABLE_REAL_ORDER", "N").upper() == "Y",
+            real=KISAccount.from_env("REAL_"),
+            vts=KISAccount.from_env("VTS_"),
+            price_cache_ttl_ms=float(os.getenv("PRICE_CACHE_TTL_MS", "500")),
+            balance_cache_ttl_ms=float(os.getenv("BALANCE_CACHE_TTL_MS", "500")),
+            kis_pin_dns=os.getenv("KIS_PIN_DNS", "N").upper() == "Y",
+            kis_warmup=os.getenv("KIS_WARMUP", "N").upper() == "Y",
+            google_sheet_key=os.getenv("GOOGLE_SHEET_KEY"),
+            google_credentials_file=os.getenv("GOOGLE_CREDENTIALS_FILE"),
+        )
+
+    def kis_account(self, mode: str) -> KISAccount:
+        return self.real if mode.upper() == "REAL" else self.vts
+
+
+settings = Settings.from_env()
@@ -1,8 +1,15 @@
 # src/engine/auto_trading_loop.py
 
+import logging
 import time
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# 시그널 없는 틱이 IDLE_BACKOFF_AFTER 회 연속되면 대기 간격을 2배씩 늘림 (최대 IDLE_MAX_MULTIPLIER 배)
+IDLE_BACKOFF_AFTER = 3
+IDLE_MAX_MULTIPLIER = 8
+
 
 class AutoTradingLoop:
     """
@@ -22,6 +29,8 @@ class AutoTradingLoop:
     - 국내(KR) + 해외(US/HK) 통합 구조 유지
     - 해외 주문 코드는 현재 모의투자에서 불가 → 주석 처리해 유지
     - 실전전환(REAL) 또는 외부 API 적용 시 즉시 활성화 가능
+    - 데드라인 기반 스케줄: 처리 시간이 길어도 주기가 밀리지 않음
+    - 무신호 / 장외 시간에는 대기 간격을 늘려 Sheets/KIS 호출 절감
     """
 
     def __init__(
@@ -31,7 +40,8 @@ class AutoTradingLoop:
             portfolio_engine,
             risk_engine,
             sheet_client,
-            interval_sec=60
+            interval_sec=60,
+            trading_hours=None
     ):
         self.broker = broker
         self.strategy_engine = strategy_engine
@@ -40,6 +50,15 @@ class AutoTradingLoop:
         self.sheet = sheet_client
         self.interval = interval_sec
 
+        # 장 운영 시간 (start, end) datetime.time 튜플. None 이면 항상 운영
+        # 예) (time(9, 0), time(15, 30))
+        self.trading_hours = trading_hours
+
+        # 무신호 백오프 상태
+        self.idle_ticks = 0
+        self.idle_multiplier = 1
+        self._off_hours = False
+
         # KillSwitch 상태 (Config 시트에서 읽어올 수도 있음)
         self.kill_switch = False
 
@@ -47,124 +66,193 @@ class AutoTradingLoop:
     # 루프 시작
     # =====================================================================
     def start(self):
-        print("\n=== Auto Trading Loop Start ===\n")
+        logger.info("=== Auto Trading Loop Start ===")
+
+        next_tick = time.monotonic()
 
         while True:
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            print(f"\n[{now}] ===== 자동매매 루프 실행 =====")
+            had_signals = self.run_once()
+            self._update_idle(had_signals)
 
             # -------------------------------------------------------------
-            # 0) KillSwitch 검사
+            # 대기 후 다음 루프 실행 (고정 sleep 대신 다음 데드라인까지)
             # -------------------------------------------------------------
-            if self.kill_switch:
-                print("[KILL SWITCH] 자동매매 정지됨 (매매 스킵)")
-                time.sleep(self.interval)
-                continue
+            now = time.monotonic()
+            next_tick = max(next_tick + self.interval * self.idle_multiplier, now)
+            wait = next_tick - now
 
-            # -------------------------------------------------------------
-            # 1) 포트폴리오 평가
-            # -------------------------------------------------------------
-            portfolio_state = self.portfolio_engine.build_portfolio_state()
-            print("[INFO] 포트폴리오 평가 완료")
+            logger.info("[LOOP] %.1f초 대기 후 다음 루프 실행", wait)
+            time.sleep(wait)
 
-            # -------------------------------------------------------------
-            # 2) 리스크 체크
-            # -------------------------------------------------------------
-            risk_ok = self.risk_engine.check_all(portfolio_state)
-            if not risk_ok:
-                print("[RISK] 리스크 제한 초과 → 매매 스킵")
-                time.sleep(self.interval)
-                continue
+    # =====================================================================
+    # 무신호 / 장외 시간 백오프
+    # =====================================================================
+    def _in_trading_hours(self) -> bool:
+        if self.trading_hours is None:
+            return True
 
-            # -------------------------------------------------------------
-            # 3) 전략 엔진 실행
-            # -------------------------------------------------------------
-            signals = self.strategy_engine.generate_signals(portfolio_state)
+        now = datetime.now()
+        if now.weekday() >= 5:
+            return False
 
-            if not signals:
-                print("[STRATEGY] 시그널 없음 → 대기")
-                time.sleep(self.interval)
-                continue
+        start, end = self.trading_hours
+        return start <= now.time() <= end
 
-            print(f"[STRATEGY] 시그널 {len(signals)}개 감지")
+    def _update_idle(self, had_signals: bool):
+        if had_signals:
+            self.idle_ticks = 0
+            self.idle_multiplier = 1
+            return
+
+        if not self._in_trading_hours():
+            self._off_hours = True
+            self.idle_multiplier = IDLE_MAX_MULTIPLIER
+            return
+
+        # 장외 → 장중 전환 시 백오프 초기화 (개장 직후 기본 주기로 복귀)
+        if self._off_hours:
+            self._off_hours = False
+            self.idle_ticks = 0
+            self.idle_multiplier = 1
+
+        self.idle_ticks += 1
+        if self.idle_ticks >= IDLE_BACKOFF_AFTER:
+            self.idle_multiplier = min(self.idle_multiplier * 2, IDLE_MAX_MULTIPLIER)
+
+    # =====================================================================
+    # 루프 1회 실행 (시그널을 처리했으면 True)
+    # =====================================================================
+    def run_once(self) -> bool:
+        logger.info("===== 자동매매 루프 실행 =====")
+
+        # -------------------------------------------------------------
+        # 0) KillSwitch 검사
+        # -------------------------------------------------------------
+        if self.kill_switch:
+            logger.warning("[KILL SWITCH] 자동매매 정지됨 (매매 스킵)")
+            return False
+
+        # -------------------------------------------------------------
+        # 1) 포트폴리오 평가
+        # -------------------------------------------------------------
+        portfolio_state = self.portfolio_engine.build_portfolio_state()
+        logger.info("포트폴리오 평가 완료")
+
+        # -------------------------------------------------------------
+        # 2) 리스크 체크
+        # -------------------------------------------------------------
+        risk_ok = self.risk_engine.check_all(portfolio_state)
+        if not risk_ok:
+            logger.warning("[RISK] 리스크 제한 초과 → 매매 스킵")
+            return False
+
+        # -------------------------------------------------------------
+        # 3) 전략 엔진 실행
+        # -------------------------------------------------------------
+        signals = self.strategy_engine.generate_signals(portfolio_state)
+
+        if not signals:
+            logger.info("[STRATEGY] 시그널 없음 → 대기")
+            return False
+
+        logger.info("[STRATEGY] 시그널 %d개 감지", len(signals))
+
+        # -------------------------------------------------------------
+        # 4) 시그널 처리 (국내/해외 매매 포함)
+        # -------------------------------------------------------------
+        executed = []
+
+        for sig in signals:
+            action = sig.get("type")
+            symbol = sig.get("symbol")
+            qty = sig.get("qty", 0)
+            price = sig.get("price", 0)
+            market = sig.get("market", "KR").upper()
+
+            logger.info("[SIGNAL] %s / %s / %s / %s", market, action, symbol, qty)
+
+            # ---------------------------
+            # 국내 주식 주문 처리
+            # ---------------------------
+            if market == "KR":
+
+                if action == "BUY":
+                    logger.info("[ORDER] 국내 매수 요청: %s, %s", symbol, qty)
+                    result = self.broker.buy(
+                        symbol=symbol,
+                        qty=qty,
+                        order_type="03"  # 시장가
+                    )
+
+                elif action == "SELL":
+                    logger.info("[ORDER] 국내 매도 요청: %s, %s", symbol, qty)
+                    result = self.broker.sell(
+                        symbol=symbol,
+                        qty=qty,
+                        order_type="03"
+                    )
 
-            # -------------------------------------------------------------
-            # 4) 시그널 처리 (국내/해외 매매 포함)
-            # -------------------------------------------------------------
-            for sig in signals:
-                action = sig.get("type")
-                symbol = sig.get("symbol")
-                qty = sig.get("qty", 0)
-                price = sig.get("price", 0)
-                market = sig.get("market", "KR").upper()
-
-                print(f"[SIGNAL] {market} / {action} / {symbol} / {qty}")
-
-                # ---------------------------
-                # 국내 주식 주문 처리
-                # ---------------------------
-                if market == "KR":
-
-                    if action == "BUY":
-                        print(f"[ORDER] 국내 매수 요청: {symbol}, {qty}")
-                        result = self.broker.buy(
-                            symbol=symbol,
-                            qty=qty,
-                            order_type="03"  # 시장가
-                        )
-
-                    elif action == "SELL":
-                        print(f"[ORDER] 국내 매도 요청: {symbol}, {qty}")
-                        result = self.broker.sell(
-                            symbol=symbol,
-                            qty=qty,
-                            order_type="03"
-                        )
-
-                    else:
-                        print(f"[SKIP] 알 수 없는 타입: {action}")
-                        continue
-
-                # ---------------------------
-                # 해외 주식 주문 처리 (주석)
-                # ---------------------------
                 else:
-                    print(f"[OVERSEAS] 해외 종목 주문 감지됨: {market} {symbol}")
-
-                    # ※ KIS 모의투자에서는 해외 주문이 동작하지 않으므로
-                    # 아래 코드는 향후 실전 모드에서 활성화
-                    #
-                    # if action == "BUY":
-                    #     result = self.broker.buy_overseas(
-                    #         symbol=symbol,
-                    #         exch=market,
-                    #         qty=qty
-                    #     )
-                    # elif action == "SELL":
-                    #     result = self.broker.sell_overseas(
-                    #         symbol=symbol,
-                    #         exch=market,
-                    #         qty=qty
-                    #     )
-                    # else:
-                    #     print("[OVERSEAS] 알 수 없는 시그널 타입")
-                    #     continue
-                    #
-                    # 해외는 현재 무조건 스킵
-                    result = None
-
-                # ---------------------------------------------------------
-                # 5) 주문 성공 시 Google Sheets 기록
-                # ---------------------------------------------------------
-                if result:
-                    print("[SHEET] 거래 기록 저장")
-                    try:
-                        self.sheet.append_trade(result, sig)
-                    except Exception as e:
-                        print("[SHEET ERROR] 기록 실패:", str(e))
+                    logger.warning("[SKIP] 알 수 없는 타입: %s", action)
+                    continue
 
-            # -------------------------------------------------------------
-            # 6) 대기 후 다음 루프 실행
-            # -------------------------------------------------------------
-            print(f"[LOOP] {self.interval}초 대기 후 다음 루프 실행\n")
-            time.sleep(self.interval)
+            # ---------------------------
+            # 해외 주식 주문 처리 (주석)
+            # ---------------------------
+            else:
+                logger.info("[OVERSEAS] 해외 종목 주문 감지됨: %s %s", market, symbol)
+
+                # ※ KIS 모의투자에서는 해외 주문이 동작하지 않으므로
+                # 아래 코드는 향후 실전 모드에서 활성화
+                #
+                # if action == "BUY":
+                #     result = self.broker.buy_overseas(
+                #         symbol=symbol,
+                #         exch=market,
+                #         qty=qty
+                #     )
+                # elif action == "SELL":
+                #     result = self.broker.sell_overseas(
+                #         symbol=symbol,
+                #         exch=market,
+                #         qty=qty
+                #     )
+                # else:
+                #     logger.warning("[OVERSEAS] 알 수 없는 시그널 타입")
+                #     continue
+                #
+                # 해외는 현재 무조건 스킵
+                result = None
+
+            # 주문 성공 건은 모아서 루프 종료 후 일괄 기록
+            if result:
+                executed.append((result, sig))
+
+        # -------------------------------------------------------------
+        # 5) 주문 성공 건 Google Sheets 일괄 기록
+        # -------------------------------------------------------------
+        if executed:
+            self._record_trades(executed)
+
+            # 보유 종목 변경 → 다음 틱에 Position 재조회
+            invalidate = getattr(self.portfolio_engine, "invalidate_positions", None)
+            if invalidate is not None:
+                invalidate()
+
+        return True
+
+    def _record_trades(self, executed):
+        """
+        체결 건을 시트에 1회 호출로 기록 (append_trades 지원 시).
+        기록 실패는 로그만 남기고 루프는 계속.
+        """
+        logger.info("[SHEET] 거래 기록 저장 (%d건)", len(executed))
+        try:
+            append_trades = getattr(self.sheet, "append_trades", None)
+            if append_trades is not None:
+                append_trades(executed)
+            else:
+                for result, sig in executed:
+                    self.sheet.append_trade(result, sig)
+        except Exception as e:
+            logger.error("[SHEET ERROR] 기록 실패: %s", e)
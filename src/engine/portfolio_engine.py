@@ -1,9 +1,65 @@
 # src/engine/portfolio_engine.py
 
-from typing import Dict, List, Any
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from math import fsum
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import pandas as pd  # 선택 의존성: 대량 DT_Report 집계 벡터화
+except ImportError:
+    pd = None
+
 from brokers.broker_interface import BrokerInterface
+from brokers.price_service import PriceService
 from sheets.position_repo import PositionRepository
 from sheets.dt_report_repo import DTReportRepository
+from sheets.sheets_facade import SheetsFacade
+
+
+@dataclass(slots=True, frozen=True)
+class EvaluatedPosition:
+    """evaluate_positions 결과 1건 (보유 종목 평가)"""
+    symbol: str
+    qty: float
+    avg_price: float
+    current_price: float
+    valuation: float
+    cost: float
+    pnl: float
+    market: str
+
+
+@lru_cache(maxsize=8192)
+def _parse_number(s: str) -> float:
+    """문자열 셀("1,234.5" 등) 파싱. 같은 문자열이 반복되므로 결과 캐시"""
+    s = s.replace(",", "").strip()
+    if s == "":
+        return 0.0
+
+    try:
+        return float(s)
+    except ValueError:
+        return 0.0
+
+
+def _price_unavailable(symbol: str) -> float:
+    return 0.0
+
+
+# 해외 시장: 구조는 유지, 현재는 0 반환
+# (실전 전환 / 외부 API 연동 시 broker.get_overseas_price("NASD"/"HKG", symbol) 로 교체)
+OVERSEAS_MARKETS = ("US", "NASDAQ", "NYSE", "AMEX", "HK")
+KNOWN_MARKETS = frozenset(("KR",) + OVERSEAS_MARKETS)
+
+
+# Position 캐시 안전 TTL (시트 직접 수정 등 외부 변경 대비)
+POSITION_CACHE_TTL_SEC = 300.0
+
+
+# 이 건수 이상이면 pandas 벡터화 집계 사용 (미만은 단일 패스 루프가 더 빠름)
+DT_VECTORIZE_MIN_ROWS = 1000
 
 
 class PortfolioEngine:
@@ -13,7 +69,7 @@ class PortfolioEngine:
     기능 요약:
     - Position Sheet(보유종목) 로딩
     - DT_Report 기반 평균단가 재계산 (보정)
-    - KISBroker 기반 현재가 조회(get_price)
+    - KISBroker 기반 현재가 일괄 조회(get_prices)
     - KR / US / HK 통합 시장 구조 유지
     - 해외 시세는 현재 비활성(0) 처리하지만 구조는 그대로 보존
     """
@@ -23,159 +79,289 @@ class PortfolioEngine:
         broker: BrokerInterface,
         position_repo: PositionRepository,
         dt_repo: DTReportRepository,
-        initial_cash: float = 0.0
+        initial_cash: float = 0.0,
+        price_service: Optional[PriceService] = None,
+        sheets: Optional[SheetsFacade] = None
     ):
         self.broker = broker
+        # Position / DT_Report 를 batchGet 1회로 묶어 읽는 facade (없으면 시트별 조회)
+        self.sheets = sheets
+        # AppContext 의 공용 PriceService (없으면 broker.get_prices 직접 사용)
+        self.price_service = price_service
         self.position_repo = position_repo
         self.dt_repo = dt_repo
         self.initial_cash = initial_cash
 
+        # Position 시트 캐시: 주문 체결 시 invalidate_positions() 로 무효화
+        self._positions_cache: Optional[List[Dict[str, Any]]] = None
+        self._positions_loaded_at = 0.0
+
+        # 시장 코드 → 현재가 조회 함수 (KR 은 evaluate_positions 에서 일괄 조회 결과로 연결)
+        self._market_router = {market: _price_unavailable for market in OVERSEAS_MARKETS}
+
     # ------------------------------------------------------------
     # float 변환 안전 처리
     # ------------------------------------------------------------
     @staticmethod
     def _to_float(value: Any) -> float:
-        if value is None:
+        # 시트 숫자 셀(float/int)이 대부분 → 타입 비교로 즉시 반환
+        cls = value.__class__
+        if cls is float:
+            return value
+        if cls is int:
+            return float(value)
+        if not value:
             return 0.0
+        if cls is str:
+            return _parse_number(value)
         if isinstance(value, (int, float)):
             return float(value)
+        return _parse_number(str(value))
 
-        s = str(value).replace(",", "").strip()
-        if s == "":
-            return 0.0
+    # ------------------------------------------------------------
+    # DT_Report 단일 패스 집계
+    # ------------------------------------------------------------
+    def _aggregate_dt(
+        self,
+        records: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, float], float, float]:
+        """
+        DT_Report 를 1회 순회하며 동시에 집계.
+        - 종목별 BUY 평균단가 (amount_local 합 / qty 합)
+        - BUY / SELL net_amount_krw 합계 (현금 잔고 계산용)
+        pandas 설치 + 대량 레코드면 _aggregate_dt_df 로 위임
+        """
+        if pd is not None and len(records) >= DT_VECTORIZE_MIN_ROWS:
+            return self._aggregate_dt_df(records)
 
-        try:
-            return float(s)
-        except ValueError:
-            return 0.0
+        to_float = self._to_float
+        buy_qty: Dict[str, float] = {}
+        buy_amount: Dict[str, float] = {}
+        buy_sum_krw = 0.0
+        sell_sum_krw = 0.0
+
+        for r in records:
+            side = (r.get("side") or "").upper()
+
+            if side == "BUY":
+                buy_sum_krw += to_float(r.get("net_amount_krw"))
+
+                symbol = r.get("symbol")
+                buy_qty[symbol] = buy_qty.get(symbol, 0.0) + to_float(r.get("qty"))
+                buy_amount[symbol] = buy_amount.get(symbol, 0.0) + to_float(r.get("amount_local"))
+
+            elif side == "SELL":
+                sell_sum_krw += to_float(r.get("net_amount_krw"))
+
+        avg_price_by_symbol = {
+            symbol: buy_amount[symbol] / qty
+            for symbol, qty in buy_qty.items()
+            if qty > 0
+        }
+        return avg_price_by_symbol, buy_sum_krw, sell_sum_krw
+
+    @staticmethod
+    def _aggregate_dt_df(
+        records: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, float], float, float]:
+        """_aggregate_dt 의 pandas 벡터화 버전 (결과 동일)"""
+        df = pd.DataFrame.from_records(
+            records,
+            columns=["symbol", "side", "qty", "amount_local", "net_amount_krw"],
+        )
+
+        for col in ("qty", "amount_local", "net_amount_krw"):
+            df[col] = pd.to_numeric(
+                df[col].astype(str).str.replace(",", "", regex=False).str.strip(),
+                errors="coerce",
+            ).fillna(0.0)
+
+        side = df["side"].fillna("").astype(str).str.upper().astype("category")
+        net_by_side = df.groupby(side, observed=True)["net_amount_krw"].sum()
+
+        buys = df[side == "BUY"]
+        grouped = buys.groupby(buys["symbol"].astype("category"), observed=True)[["qty", "amount_local"]].sum()
+        grouped = grouped[grouped["qty"] > 0]
+
+        avg_price_by_symbol = (grouped["amount_local"] / grouped["qty"]).to_dict()
+        return (
+            avg_price_by_symbol,
+            float(net_by_side.get("BUY", 0.0)),
+            float(net_by_side.get("SELL", 0.0)),
+        )
 
     # ------------------------------------------------------------
     # DT_Report 기반 평균단가 (보정)
     # ------------------------------------------------------------
-    def _calculate_avg_price_from_dt(self, symbol: str) -> float:
-        records = self.dt_repo.load_all()
+    def _calculate_avg_price_from_dt(
+        self,
+        symbol: str,
+        records: Optional[List[Dict[str, Any]]] = None
+    ) -> float:
+        if records is None:
+            records = self.dt_repo.load_all()
 
-        total_qty = 0.0
-        total_amount = 0.0
+        avg_price_by_symbol, _, _ = self._aggregate_dt(records)
+        return avg_price_by_symbol.get(symbol, 0.0)
 
-        for r in records:
-            if r.get("symbol") != symbol:
-                continue
+    # ------------------------------------------------------------
+    # Position 로드 (캐시)
+    # ------------------------------------------------------------
+    def _positions_stale(self) -> bool:
+        return (
+            self._positions_cache is None
+            or time.monotonic() - self._positions_loaded_at > POSITION_CACHE_TTL_SEC
+        )
+
+    def _load_positions(self) -> List[Dict[str, Any]]:
+        if self._positions_stale():
+            self._positions_cache = self.position_repo.load_all()
+            self._positions_loaded_at = time.monotonic()
+        return self._positions_cache
+
+    def _load_dt_records(self) -> List[Dict[str, Any]]:
+        """
+        DT_Report 전체 조회.
+        Position 캐시도 만료 상태면 facade 로 두 시트를 batchGet 1회에 함께 조회해 캐시 갱신.
+        """
+        if self.sheets is None or not self._positions_stale():
+            return self.dt_repo.load_all()
 
-            if (r.get("side") or "").upper() != "BUY":
-                continue
+        position_sheet = self.position_repo.sheet_name
+        dt_sheet = self.dt_repo.sheet_name
+        data = self.sheets.load_many([position_sheet, dt_sheet])
 
-            qty = self._to_float(r.get("qty"))
-            amount = self._to_float(r.get("amount_local"))
+        self._positions_cache = data[position_sheet]
+        self._positions_loaded_at = time.monotonic()
+        return data[dt_sheet]
 
-            total_qty += qty
-            total_amount += amount
+    def invalidate_positions(self, *_args) -> None:
+        """
+        주문 체결 후 호출 → 다음 평가 시 Position 시트 재조회.
+        (OrderExecutor fill listener 로 등록 가능하도록 인자는 무시)
+        """
+        self._positions_cache = None
 
-        if total_qty <= 0:
-            return 0.0
+    def _fetch_kr_prices(self, symbols: List[str]) -> Dict[str, float]:
+        if self.price_service is None:
+            return self.broker.get_prices(symbols)
 
-        return total_amount / total_qty
+        prices = self.price_service.get_live_prices((symbol, "KR") for symbol in symbols)
+        return {symbol: price for (symbol, _), price in prices.items()}
 
     # ------------------------------------------------------------
     # 포지션 개별 평가
     # ------------------------------------------------------------
-    def evaluate_positions(self) -> List[Dict]:
+    def evaluate_positions(self, avg_price_by_symbol: Optional[Dict[str, float]] = None) -> List[EvaluatedPosition]:
         """
         KR / US / HK 를 모두 지원하는 형태로 구조 유지.
         해외는 현재 시세 비활성(0 처리).
+        avg_price_by_symbol: DT_Report 기반 종목별 평균단가 (없으면 필요 시 1회 집계)
         """
-        positions = self.position_repo.load_all()
-        evaluated = []
+        positions = self._load_positions()
+        to_float = self._to_float
+
+        # ----------------------------------------
+        # 1차: 유효 포지션 정리 + 평균단가 보정
+        # ----------------------------------------
+        holdings = []
+        kr_symbols = []
 
         for p in positions:
             symbol = p.get("symbol")
             if not symbol:
                 continue
 
-            qty = self._to_float(p.get("qty"))
+            qty = to_float(p.get("qty"))
             if qty <= 0:
                 continue
 
-            market = (p.get("market") or "").upper()
-            avg_price = self._to_float(p.get("avg_price"))
+            market = p.get("market") or ""
+            if market not in KNOWN_MARKETS:
+                # 정규화되지 않은 시장 코드만 대문자 변환 (대부분 시트 값 그대로 dict 조회)
+                market = market.upper()
+            avg_price = to_float(p.get("avg_price"))
 
             if avg_price <= 0:
-                avg_price = self._calculate_avg_price_from_dt(symbol)
+                if avg_price_by_symbol is None:
+                    avg_price_by_symbol, _, _ = self._aggregate_dt(self.dt_repo.load_all())
+                avg_price = avg_price_by_symbol.get(symbol, 0.0)
 
-            # ----------------------------------------
-            # 시장별 현재가 조회
-            # ----------------------------------------
             if market == "KR":
-                # 국내: 정상 작동
-                current_price = self.broker.get_price(symbol)
+                kr_symbols.append(symbol)
 
-            elif market in ("US", "NASDAQ", "NYSE", "AMEX"):
-                # 해외: 구조는 유지, 현재는 0 반환
-                # (실전 전환 / 외부 API 연동 시 활성화)
-                # current_price = self.broker.get_overseas_price("NASD", symbol)
-                current_price = 0.0
+            holdings.append((symbol, qty, market, avg_price))
 
-            elif market == "HK":
-                # 홍콩 시장 기능도 유지
-                # current_price = self.broker.get_overseas_price("HKG", symbol)
-                current_price = 0.0
+        # ----------------------------------------
+        # 국내 현재가 일괄 조회 (종목별 순차 호출 대신 1회 배치 조회)
+        # ----------------------------------------
+        kr_prices = self._fetch_kr_prices(kr_symbols) if kr_symbols else {}
 
+        # ----------------------------------------
+        # 2차: 시장별 현재가 매핑 + 평가
+        # ----------------------------------------
+        evaluated = []
+
+        if len(kr_symbols) == len(holdings):
+            # 국내 전용 포트폴리오 (일반적인 경우): 시장 라우팅 생략
+            price_of = None
+        else:
+            price_of = dict(self._market_router)
+            price_of["KR"] = lambda symbol: kr_prices.get(symbol, 0.0)
+
+        for symbol, qty, market, avg_price in holdings:
+            if price_of is None:
+                current_price = kr_prices.get(symbol, 0.0)
             else:
-                # 정의되지 않은 시장
-                current_price = 0.0
+                # 정의되지 않은 시장은 0
+                current_price = price_of.get(market, _price_unavailable)(symbol)
 
             valuation = current_price * qty
             cost = avg_price * qty
             pnl = valuation - cost
 
-            evaluated.append({
-                "symbol": symbol,
-                "qty": qty,
-                "avg_price": avg_price,
-                "current_price": current_price,
-                "valuation": valuation,
-                "cost": cost,
-                "pnl": pnl,
-                "market": market
-            })
+            evaluated.append(EvaluatedPosition(
+                symbol=symbol,
+                qty=qty,
+                avg_price=avg_price,
+                current_price=current_price,
+                valuation=valuation,
+                cost=cost,
+                pnl=pnl,
+                market=market
+            ))
 
         return evaluated
 
     # ------------------------------------------------------------
     # 현금 잔고 계산
     # ------------------------------------------------------------
-    def calculate_cash_balance(self) -> float:
+    def calculate_cash_balance(self, records: Optional[List[Dict[str, Any]]] = None) -> float:
         """
         initial_cash + SELL - BUY
         (DT_Report 기준)
         """
-        records = self.dt_repo.load_all()
-
-        buy_amount = 0.0
-        sell_amount = 0.0
-
-        for r in records:
-            side = (r.get("side") or "").upper()
-            net = self._to_float(r.get("net_amount_krw"))
-
-            if side == "BUY":
-                buy_amount += net
-            elif side == "SELL":
-                sell_amount += net
+        if records is None:
+            records = self.dt_repo.load_all()
 
+        _, buy_amount, sell_amount = self._aggregate_dt(records)
         return self.initial_cash + sell_amount - buy_amount
 
     # ------------------------------------------------------------
     # 전체 포트폴리오 평가 결과
     # ------------------------------------------------------------
     def build_portfolio_state(self) -> Dict:
-        positions = self.evaluate_positions()
+        # DT_Report 는 1회만 읽고 1회 순회로 평균단가 / 현금 집계
+        avg_price_by_symbol, buy_amount, sell_amount = self._aggregate_dt(self._load_dt_records())
+
+        positions = self.evaluate_positions(avg_price_by_symbol)
 
-        stock_equity = sum(p["valuation"] for p in positions)
-        cost_basis = sum(p["cost"] for p in positions)
-        total_pnl = sum(p["pnl"] for p in positions)
+        # 종목 수와 무관하게 math.fsum (정확한 합 → 반올림 오차 누적 없음)
+        stock_equity = fsum(p.valuation for p in positions)
+        cost_basis = fsum(p.cost for p in positions)
+        total_pnl = fsum(p.pnl for p in positions)
 
-        cash_balance = self.calculate_cash_balance()
+        cash_balance = self.initial_cash + sell_amount - buy_amount
         total_equity = stock_equity + cash_balance
 
         exposure = stock_equity / total_equity if total_equity > 0 else 0
@@ -8,21 +8,28 @@ class EventQueue:
     """
     TradingEngine이 사용할 내부 시그널/이벤트 큐
     매우 단순한 FIFO 큐
+
+    - deque.append / popleft 는 C 레벨 단일 연산 → GIL 하에서 원자적
+      (전략 스레드 push / 엔진 루프 pop 조합에 별도 lock 불필요)
+    - pop 은 빈 큐 검사 없이 popleft 1회 (검사-후-꺼내기 경쟁 제거)
     """
 
     def __init__(self):
         self._queue = deque()
+        self._append = self._queue.append
+        self._popleft = self._queue.popleft
 
     def push(self, item: Any):
-        self._queue.append(item)
+        self._append(item)
 
     def pop(self) -> Optional[Any]:
-        if self._queue:
-            return self._queue.popleft()
-        return None
+        try:
+            return self._popleft()
+        except IndexError:
+            return None
 
     def is_empty(self) -> bool:
-        return len(self._queue) == 0
+        return not self._queue
 
     def size(self) -> int:
         return len(self._queue)
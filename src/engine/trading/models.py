@@ -1,8 +1,9 @@
 # src/engine/trading/models.py
 
 from __future__ import annotations
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, Dict, Any
 
@@ -28,28 +29,124 @@ class OrderType(str, Enum):
     LIMIT = "LIMIT"
 
 
+# ============================================================
+# TIMESTAMP FACTORY
+#   시그널/주문 burst 시 매 생성마다 시계 조회 + datetime 생성 방지
+#   1ms 이내 생성분은 같은 datetime(불변) 공유. 정밀 시각 필요 시 호출측에서 직접 지정
+# ============================================================
+
+_CLOCK_RESOLUTION_SEC = 0.001
+_clock_cache = (0.0, datetime.min)   # (time.time(), naive UTC datetime)
+
+
+def _utcnow() -> datetime:
+    global _clock_cache
+    t = time.time()
+    last_t, last_dt = _clock_cache
+    if 0.0 <= t - last_t < _CLOCK_RESOLUTION_SEC:
+        return last_dt
+
+    # 기존 datetime.utcnow() 와 동일한 naive UTC
+    dt = datetime.fromtimestamp(t, timezone.utc).replace(tzinfo=None)
+    _clock_cache = (t, dt)
+    return dt
+
+
+# ============================================================
+# COMPACT RAW
+#   키 몇 개짜리 브로커 응답을 dict 대신 평탄 tuple (k1, v1, k2, v2, ...) 로 보관
+#   체결 이력을 메모리에 오래 들고 있는 엔진용. 읽기 전용 (get / [] / in / items)
+# ============================================================
+
+COMPACT_RAW_MAX_KEYS = 4
+
+
+class CompactRaw:
+    __slots__ = ("_items",)
+
+    def __init__(self, mapping: Dict[str, Any]):
+        flat = []
+        for key, value in mapping.items():
+            flat.append(key)
+            flat.append(value)
+        self._items = tuple(flat)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        items = self._items
+        for i in range(0, len(items), 2):
+            if items[i] == key:
+                return items[i + 1]
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items[::2]
+
+    def __len__(self) -> int:
+        return len(self._items) // 2
+
+    def __iter__(self):
+        return iter(self._items[::2])
+
+    def keys(self):
+        return self._items[::2]
+
+    def items(self):
+        items = self._items
+        return tuple(zip(items[::2], items[1::2]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactRaw):
+            return self._items == other._items
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactRaw({self.to_dict()!r})"
+
+
+_MISSING = object()
+
+
+def compact_raw(raw: Optional[Dict[str, Any]]) -> Any:
+    """키 수가 COMPACT_RAW_MAX_KEYS 이하인 dict 만 CompactRaw 로 변환, 나머지는 그대로"""
+    if type(raw) is dict and len(raw) <= COMPACT_RAW_MAX_KEYS:
+        return CompactRaw(raw)
+    return raw
+
+
 # ============================================================
 # 1) TradeSignal
 #    전략/조건식에서 올라오는 "시그널" 데이터
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     symbol: str
     market: MarketType
     side: OrderSide
     strategy: str                      # 예: "GC_RSI", "BB", "ATR", "COND01"
     priority: int = 0                  # 추후 우선순위큐 활용 시 사용
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_utcnow)
     meta: Optional[Dict[str, Any]] = None
 
 
 # ============================================================
 # 2) OrderRequest
 #    TradingEngine가 실제 브로커로 내보내는 구체적 주문 요청
+#    PositionSizer 가 위치 인자로 생성하므로 필드 순서 변경 시 함께 수정
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class OrderRequest:
     symbol: str
     market: MarketType
@@ -61,15 +158,16 @@ class OrderRequest:
     broker: Optional[str] = ""         # "KIS", "KIWOOM_REST", "KIWOOM_COM"
     slippage_limit: Optional[float] = None
     meta: Optional[Dict[str, Any]] = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_utcnow)
 
 
 # ============================================================
 # 3) OrderResult
 #    브로커 체결 정보 (DT_Report에 기록할 데이터 완비)
+#    OrderExecutor 가 위치 인자로 생성하므로 필드 순서 변경 시 함께 수정
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     order_id: str
     symbol: str
@@ -83,5 +181,5 @@ class OrderResult:
     fx_rate: float                     # 환율
     amount_krw: float                  # 원화 기준 체결금액
     broker: str                        # "KIS", "KIWOOM_REST", "KIWOOM_COM"
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    raw: Optional[Dict[str, Any]] = None  # 브로커 원본 JSON 응답(Optional)
+    timestamp: datetime = field(default_factory=_utcnow)
+    raw: Optional[Dict[str, Any]] = None  # 브로커 원본 JSON 응답(Optional, CompactRaw 가능)
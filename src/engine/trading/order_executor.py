@@ -1,9 +1,32 @@
 # src/engine/trading/order_executor.py
 
 from __future__ import annotations
-from typing import Any
+import logging
+from operator import itemgetter
+from typing import Any, Callable, List
 
-from .models import OrderRequest, OrderResult
+from .models import OrderRequest, OrderResult, OrderSide, compact_raw
+
+logger = logging.getLogger(__name__)
+
+# 브로커 일괄 주문 1회당 최대 주문 수
+BATCH_ORDER_LIMIT = 50
+
+# 브로커 dict 응답 → OrderResult 변환 시 기본값 (키 순서 = OrderResult 필드 순서)
+_RESULT_DEFAULTS = {
+    "order_id": "",
+    "avg_price": 0,
+    "fee_tax": 0,
+    "amount_local": 0,
+    "currency": "KRW",
+    "fx_rate": 1,
+    "amount_krw": 0,
+    "broker": "KIS",
+}
+_get_result_fields = itemgetter(*_RESULT_DEFAULTS)
+
+# OrderSide 는 str Enum → "BUY" 문자열로 들어온 side 도 == 로 같은 쪽 판정
+_SIDE_BUY = OrderSide.BUY
 
 
 class OrderExecutor:
@@ -11,10 +34,27 @@ class OrderExecutor:
     OrderExecutor:
     - BrokerInterface 기반으로 실 거래 요청 수행
     - OrderResult를 표준화하여 반환
+    - 주문 완료 시 등록된 fill listener 호출 (포지션 캐시 무효화 등)
+    - use_compact_raw=True 이면 작은 raw 응답을 CompactRaw 로 축소
     """
 
-    def __init__(self, broker: Any):
+    def __init__(self, broker: Any, use_compact_raw: bool = False):
         self.broker = broker
+        # True 이면 키가 적은 raw 응답을 CompactRaw 로 보관 (체결 이력 메모리 절감)
+        self._compact_raw = use_compact_raw
+        # 브로커가 OrderResult 반환을 선언하면 응답마다 isinstance 검사 생략
+        self._returns_result = bool(getattr(broker, "returns_order_result", False))
+        self._fill_listeners: List[Callable[[OrderResult], None]] = []
+
+    def add_fill_listener(self, listener: Callable[[OrderResult], None]) -> None:
+        self._fill_listeners.append(listener)
+
+    def _notify_filled(self, result: OrderResult) -> None:
+        for listener in self._fill_listeners:
+            try:
+                listener(result)
+            except Exception:
+                logger.exception("fill listener 오류: %s", result.symbol)
 
     # ------------------------------------------------------------
     # 주문 실행
@@ -26,30 +66,79 @@ class OrderExecutor:
             sell(order: OrderRequest) -> OrderResult
         """
 
-        if order.side == order.side.BUY:
+        if order.side == _SIDE_BUY:
             result = self.broker.buy(order)
         else:
             result = self.broker.sell(order)
 
         # result는 KISBroker에서 반환하는 dict 또는 class일 수 있음
         # TradingEngine이 표준 OrderResult로 사용해야 하므로 확인/변환 필요
+        # (returns_order_result 를 선언한 브로커는 확인 생략)
+
+        if not self._returns_result and not isinstance(result, OrderResult):
+            # 브로커 응답이 dict라면 OrderResult 변환
+            result = self._to_order_result(order, result)
+
+        if self._compact_raw:
+            result.raw = compact_raw(result.raw)
+
+        self._notify_filled(result)
+        return result
+
+    # ------------------------------------------------------------
+    # 일괄 주문 실행
+    # ------------------------------------------------------------
+    def execute_batch(self, orders: List[OrderRequest]) -> List[OrderResult]:
+        """
+        BrokerInterface (선택):
+            batch_buy(orders: List[OrderRequest]) -> List[OrderResult | dict]
+            batch_sell(orders: List[OrderRequest]) -> List[OrderResult | dict]
+        브로커가 일괄 주문을 지원하지 않으면 주문별 execute 로 처리.
+        결과는 orders 순서와 동일.
+        """
+        batch_buy = getattr(self.broker, "batch_buy", None)
+        batch_sell = getattr(self.broker, "batch_sell", None)
+        if batch_buy is None or batch_sell is None:
+            return [self.execute(order) for order in orders]
+
+        results: List[OrderResult] = [None] * len(orders)
+        returns_result = self._returns_result
+        compact = self._compact_raw
+
+        # execute 와 같은 if/else 로 분할 → 모든 주문이 한쪽에 속함 (None 슬롯 없음)
+        buy_indices: List[int] = []
+        sell_indices: List[int] = []
+        for i, order in enumerate(orders):
+            if order.side == _SIDE_BUY:
+                buy_indices.append(i)
+            else:
+                sell_indices.append(i)
+
+        for indices, submit in ((buy_indices, batch_buy), (sell_indices, batch_sell)):
+            for start in range(0, len(indices), BATCH_ORDER_LIMIT):
+                chunk = indices[start:start + BATCH_ORDER_LIMIT]
+                raw_results = submit([orders[i] for i in chunk])
+
+                for i, result in zip(chunk, raw_results):
+                    if not returns_result and not isinstance(result, OrderResult):
+                        result = self._to_order_result(orders[i], result)
+                    if compact:
+                        result.raw = compact_raw(result.raw)
+                    self._notify_filled(result)
+                    results[i] = result
+
+        return results
 
-        if isinstance(result, OrderResult):
-            return result
+    @staticmethod
+    def _to_order_result(order: OrderRequest, result: dict) -> OrderResult:
+        # 기본값 병합 후 itemgetter 1회로 필드 추출 (필드별 .get 호출 제거)
+        (
+            order_id, avg_price, fee_tax, amount_local,
+            currency, fx_rate, amount_krw, broker,
+        ) = _get_result_fields({**_RESULT_DEFAULTS, **result})
 
-        # 브로커 응답이 dict라면 OrderResult 변환
         return OrderResult(
-            order_id=result.get("order_id", ""),
-            symbol=order.symbol,
-            market=order.market,
-            side=order.side,
-            qty=order.qty,
-            avg_price=result.get("avg_price", 0),
-            fee_tax=result.get("fee_tax", 0),
-            amount_local=result.get("amount_local", 0),
-            currency=result.get("currency", "KRW"),
-            fx_rate=result.get("fx_rate", 1),
-            amount_krw=result.get("amount_krw", 0),
-            broker=result.get("broker", "KIS"),
+            order_id, order.symbol, order.market, order.side, order.qty,
+            avg_price, fee_tax, amount_local, currency, fx_rate, amount_krw, broker,
             raw=result,
         )
@@ -1,10 +1,17 @@
 # src/engine/trading/order_validator.py
 
 from __future__ import annotations
+import logging
+import time
 from typing import Any
 
 from .models import TradeSignal, OrderRequest
 
+logger = logging.getLogger(__name__)
+
+# KillSwitch 상태 캐시 TTL (초). risk_engine 조회가 시트/원격일 수 있으므로 시그널마다 호출하지 않음
+KILLSWITCH_CACHE_TTL = 0.1
+
 # 향후 RiskEngine 연결 예정
 class OrderValidator:
     """
@@ -18,6 +25,31 @@ class OrderValidator:
         self.pos_repo = pos_repo
         self.config = config or {}
 
+        # (조회 시각, KillSwitch 값)
+        self._ks_cache = (float("-inf"), False)
+        self._ks_ttl = float(self.config.get("killswitch_cache_ttl", KILLSWITCH_CACHE_TTL))
+
+    # ------------------------------------------------------------
+    # KillSwitch 상태 (TTL 캐시)
+    # ------------------------------------------------------------
+    def _killswitch_on(self) -> bool:
+        now = time.monotonic()
+        ts, value = self._ks_cache
+        if now - ts > self._ks_ttl:
+            value = bool(self.risk_engine.is_killswitch_on())
+            self._ks_cache = (now, value)
+        return value
+
+    def invalidate_killswitch(self, value: bool | None = None) -> None:
+        """
+        KillSwitch 변경 통지 (risk_engine 에서 호출).
+        value 를 주면 즉시 반영, 없으면 다음 검증 시 재조회.
+        """
+        if value is None:
+            self._ks_cache = (float("-inf"), False)
+        else:
+            self._ks_cache = (time.monotonic(), bool(value))
+
     # ------------------------------------------------------------
     # 1) 시그널 단위 검증
     # ------------------------------------------------------------
@@ -27,8 +59,8 @@ class OrderValidator:
         예: KillSwitch, 전략 허용 여부, 시장 상태 체크 등
         """
         # KillSwitch
-        if self.risk_engine and self.risk_engine.is_killswitch_on():
-            print("[OrderValidator] KillSwitch ON → 시그널 차단")
+        if self.risk_engine and self._killswitch_on():
+            logger.debug("KillSwitch ON → 시그널 차단: %s", signal.symbol)
             return False
 
         # 전략별 차단 규칙 (추후 확장)
@@ -51,7 +83,7 @@ class OrderValidator:
         """
         if self.risk_engine:
             if not self.risk_engine.check_order_allowed(order):
-                print("[OrderValidator] 리스크 한도 초과로 주문 차단")
+                logger.debug("리스크 한도 초과로 주문 차단: %s", order.symbol)
                 return False
 
         # 최소 거래 수량, 금액 제한 (옵션)
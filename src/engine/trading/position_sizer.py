@@ -1,10 +1,21 @@
 # src/engine/trading/position_sizer.py
 
 from __future__ import annotations
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 
 from .models import TradeSignal, OrderRequest, MarketType, OrderSide, OrderType
 
+_ORDER_TYPE_MARKET = OrderType.MARKET
+
+
+# ------------------------------------------------------------
+# 수량 계산
+# ------------------------------------------------------------
+def _compute_qty(equity: float, risk_pct: float, price: float) -> float:
+    if price <= 0.0:
+        return 0.0
+    return (equity * risk_pct) / price
+
 
 class PositionSizer:
     """
@@ -19,6 +30,43 @@ class PositionSizer:
         self.history_repo = history_repo
         self.config = config or {}
 
+        # 배치(process_all 1회) 동안만 유지하는 조회 캐시. None 이면 배치 밖
+        self._price_cache: Optional[Dict[Tuple[str, Any], float]] = None
+        self._equity_cache: Optional[float] = None
+
+    # ------------------------------------------------------------
+    # 배치 캐시 (같은 배치 내 Equity / 현재가 중복 조회 제거)
+    # ------------------------------------------------------------
+    def begin_batch(self) -> None:
+        self._price_cache = {}
+        self._equity_cache = None
+
+    def end_batch(self) -> None:
+        self._price_cache = None
+        self._equity_cache = None
+
+    def _get_price(self, symbol: str, market: Any) -> float:
+        cache = self._price_cache
+        if cache is None:
+            return self.price_service.get_live_price(symbol, market)
+
+        key = (symbol, market)
+        price = cache.get(key)
+        if price is None:
+            price = self.price_service.get_live_price(symbol, market)
+            cache[key] = price
+        return price
+
+    def _get_equity(self) -> float:
+        if self._equity_cache is not None:
+            return self._equity_cache
+
+        equity = self.history_repo.get_latest_equity() or 0
+        if self._price_cache is not None:
+            # 배치 중이면 첫 조회 값 유지
+            self._equity_cache = equity
+        return equity
+
     # ------------------------------------------------------------
     # 전략별 기본 리스크 비율 가져오기
     # ------------------------------------------------------------
@@ -31,28 +79,20 @@ class PositionSizer:
     # ------------------------------------------------------------
     def from_signal(self, signal: TradeSignal) -> OrderRequest:
         # 현재가 조회
-        price = self.price_service.get_live_price(signal.symbol, signal.market)
+        price = self._get_price(signal.symbol, signal.market)
 
         # 현재 Equity 가져오기
-        equity = self.history_repo.get_latest_equity() or 0
+        equity = self._get_equity()
 
         # 리스크 비율
         risk_pct = self._get_risk_pct(signal.strategy)
 
-        # 포지션 노출 금액
-        notional = equity * risk_pct
-
-        # 수량 계산
-        qty = 0
-        if price > 0:
-            qty = notional / price
+        # 수량 계산 (포지션 노출 금액 / 현재가)
+        qty = _compute_qty(float(equity), risk_pct, float(price))
 
+        # 위치 인자 생성 (kwargs 매핑 생략). 순서는 OrderRequest 필드 순서와 동일
+        # broker="" → OrderExecutor가 결정할 수도 있음
         return OrderRequest(
-            symbol=signal.symbol,
-            market=signal.market,
-            side=signal.side,
-            qty=qty,
-            order_type=OrderType.MARKET,
-            strategy=signal.strategy,
-            broker="",    # OrderExecutor가 결정할 수도 있음
+            signal.symbol, signal.market, signal.side, qty,
+            _ORDER_TYPE_MARKET, None, signal.strategy, "",
         )
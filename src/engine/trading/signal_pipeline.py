@@ -0,0 +1,47 @@
+# src/engine/trading/signal_pipeline.py
+
+from __future__ import annotations
+import logging
+from typing import Optional
+
+from .models import TradeSignal, OrderRequest
+from .order_validator import OrderValidator
+from .position_sizer import PositionSizer
+
+logger = logging.getLogger(__name__)
+
+
+class SignalPipeline:
+    """
+    SignalPipeline:
+    - 시그널 검증 → 포지션 사이징 → 주문 검증을 한 번의 호출로 처리
+    - 단계별 메서드는 생성 시 1회 바인딩 (시그널마다 속성 조회 반복 제거)
+    - 검증/사이징 규칙 자체는 OrderValidator / PositionSizer 에 그대로 둔다
+    """
+
+    def __init__(self, validator: OrderValidator, sizer: PositionSizer):
+        self.validator = validator
+        self.sizer = sizer
+
+        self._validate_signal = validator.validate_signal
+        self._from_signal = sizer.from_signal
+        self._validate_order = validator.validate_order
+
+    def process(self, signal: TradeSignal) -> Optional[OrderRequest]:
+        """
+        주문 가능한 OrderRequest 반환. 검증 실패 시 None.
+        """
+        # 1) 시그널 단위 검증
+        if not self._validate_signal(signal):
+            logger.debug("시그널 검증 실패 → 처리 중단: %s", signal.symbol)
+            return None
+
+        # 2) 주문 요청 생성 (포지션 사이즈 계산)
+        order_req = self._from_signal(signal)
+
+        # 3) 주문 레벨 검증
+        if not self._validate_order(order_req):
+            logger.debug("주문 검증 실패 → 처리 중단: %s", order_req.symbol)
+            return None
+
+        return order_req
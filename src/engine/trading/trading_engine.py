@@ -1,7 +1,8 @@
 # src/engine/trading/trading_engine.py
 
 from __future__ import annotations
-from typing import Optional
+import logging
+from typing import List
 
 # 내부 모듈 (절대 패키지 import)
 from engine.trading.models import TradeSignal, OrderRequest, OrderResult
@@ -9,12 +10,15 @@ from engine.trading.event_queue import EventQueue
 from engine.trading.order_validator import OrderValidator
 from engine.trading.position_sizer import PositionSizer
 from engine.trading.order_executor import OrderExecutor
+from engine.trading.signal_pipeline import SignalPipeline
 
 # 레포지토리 모듈
 from sheets.dt_report_repository import DTReportRepository
 from sheets.position_repository import PositionRepository
 from sheets.history_repository import HistoryRepository
 
+logger = logging.getLogger(__name__)
+
 
 class TradingEngine:
     """
@@ -42,6 +46,9 @@ class TradingEngine:
         self.sizer = sizer
         self.executor = executor
 
+        # 시그널 → 주문 요청 (검증 + 사이징)
+        self.pipeline = SignalPipeline(validator, sizer)
+
         self.queue = EventQueue()
 
     # ============================================================
@@ -61,46 +68,80 @@ class TradingEngine:
 
     # ============================================================
     # 3) 큐가 빌 때까지 반복 실행
+    #    검증/사이징 후 주문은 일괄 제출 (execute_batch)
     # ============================================================
     def process_all(self) -> None:
-        while not self.queue.is_empty():
-            self.process_once()
+        orders: List[OrderRequest] = []
 
-    # ============================================================
-    # 4) 내부 처리 로직 (TradeSignal → OrderRequest → 주문 → 기록)
-    # ============================================================
-    def _handle_signal(self, signal: TradeSignal) -> None:
+        # 루프 내 속성 조회 제거
+        pop = self.queue.pop
+        prepare = self.pipeline.process
+        append = orders.append
 
-        # 1) 시그널 단위 검증
-        if not self.validator.validate_signal(signal):
-            print("[TradingEngine] 시그널 검증 실패 → 처리 중단")
+        # 배치 동안 Equity / 현재가 조회 1회로 공유
+        self.sizer.begin_batch()
+        try:
+            while (signal := pop()) is not None:
+                order_req = prepare(signal)
+                if order_req is not None:
+                    append(order_req)
+        finally:
+            self.sizer.end_batch()
+
+        if not orders:
             return
 
-        # 2) 주문 요청 생성 (포지션 사이즈 계산)
-        order_req: OrderRequest = self.sizer.from_signal(signal)
+        self._record_results(self.executor.execute_batch(orders))
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        버퍼링된 DT_Report 기록 전송 (틱 종료 시 호출, 버퍼링 미사용 시 no-op)
+        """
+        flush = getattr(self.dt_repo, "flush", None)
+        if flush is not None:
+            flush()
 
-        # 3) 주문 레벨 검증
-        if not self.validator.validate_order(order_req):
-            print("[TradingEngine] 주문 검증 실패 → 처리 중단")
+    # ============================================================
+    # 4) 내부 처리 로직 (TradeSignal → OrderRequest → 주문 → 기록)
+    # ============================================================
+    def _handle_signal(self, signal: TradeSignal) -> None:
+        # 1) ~ 3) 시그널 검증 / 사이징 / 주문 검증
+        order_req = self.pipeline.process(signal)
+        if order_req is None:
             return
 
         # 4) 브로커 주문 실행
         order_result: OrderResult = self.executor.execute(order_req)
 
-        # 5) DT_Report 기록
-        self.dt_repo.write_trade(order_result)
+        self._record_result(order_result)
 
-        # 6) Position 업데이트
-        try:
-            self.pos_repo.update_with_result(order_result)
-        except Exception as e:
-            print(f"[TradingEngine] Position 업데이트 오류: {e}")
+    def _record_result(self, order_result: OrderResult) -> None:
+        self._record_results([order_result])
+
+    def _record_results(self, order_results: List[OrderResult]) -> None:
+
+        # 5) DT_Report 기록 (여러 건이면 values.append 1회)
+        if len(order_results) == 1:
+            self.dt_repo.write_trade(order_results[0])
+        else:
+            self.dt_repo.write_trades(order_results)
 
-        # 7) History 업데이트
+        # 6) Position 업데이트 (1회 조회 + values.batchUpdate 1회)
         try:
-            self.hist_repo.update_after_trade(order_result)
-        except Exception as e:
-            print(f"[TradingEngine] History 업데이트 오류: {e}")
+            self.pos_repo.update_with_results(order_results)
+        except Exception:
+            logger.exception(
+                "Position 업데이트 오류: %s", [r.symbol for r in order_results]
+            )
+
+        for order_result in order_results:
+
+            # 7) History 업데이트
+            try:
+                self.hist_repo.update_after_trade(order_result)
+            except Exception:
+                logger.exception("History 업데이트 오류: %s", order_result.symbol)
 
         # 향후 RiskEngine 업데이트 포인트
         # if self.risk_engine:
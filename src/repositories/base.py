@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Generic, TypeVar, List, Any
 
+try:
+    import pandas as pd  # 선택 의존성: 대량 시트 로드 (fetch_all_df)
+except ImportError:
+    pd = None
+
 from src.sheets.google_client import GoogleSheetsClient
 
 T = TypeVar("T")
@@ -32,6 +38,10 @@ class BaseSheetRepository(ABC, Generic[T]):
         self.data_start_row = data_start_row
         self.columns = columns
 
+        # 컬럼 구성은 고정 → 마지막 컬럼 문자 / 조회 범위 1회 계산
+        self._last_col = self._index_to_column_letter(len(columns) - 1) if columns else "A"
+        self._range_a1 = f"A{self.data_start_row}:{self._last_col}"
+
     @property
     def last_column_letter(self) -> str:
         """
@@ -40,10 +50,10 @@ class BaseSheetRepository(ABC, Generic[T]):
         실제 구현에서는 스키마에서 column letter를 함께 넘겨 받는 방식으로 확장 가능하다.
         이 Base 클래스에서는 컬럼 개수만큼 A,B,C,... 알파벳을 생성하는 간단 버전으로 둔다.
         """
-        index = len(self.columns) - 1
-        return self._index_to_column_letter(index)
+        return self._last_col
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def _index_to_column_letter(idx: int) -> str:
         """
         0 → A, 1 → B, ..., 25 → Z, 26 → AA ...
@@ -74,11 +84,7 @@ class BaseSheetRepository(ABC, Generic[T]):
         if not self.columns:
             return []
 
-        first_col_letter = "A"
-        last_col_letter = self.last_column_letter
-        range_a1 = f"{first_col_letter}{self.data_start_row}:{last_col_letter}"
-
-        values = self.client.read_range(self.sheet_name, range_a1)
+        values = self.client.read_range(self.sheet_name, self._range_a1)
 
         results: List[T] = []
         for row in values:
@@ -90,6 +96,26 @@ class BaseSheetRepository(ABC, Generic[T]):
             results.append(entity)
         return results
 
+    def fetch_all_df(self) -> "pd.DataFrame":
+        """
+        시트 전체 데이터를 pandas.DataFrame 으로 반환 (행별 parse_row 없이 일괄 변환).
+        - 컬럼명: self.columns (헤더 기준)
+        - 완전히 비어있는 행은 제외
+        """
+        if pd is None:
+            raise ImportError("fetch_all_df requires 'pandas' (pip install pandas)")
+
+        if not self.columns:
+            return pd.DataFrame()
+
+        values = self.client.read_range(self.sheet_name, self._range_a1) or []
+
+        # 뒤쪽 빈 셀 생략분은 NaN → "" 로 채움 (컬럼 수 초과분은 절단)
+        df = pd.DataFrame(values).reindex(columns=range(len(self.columns))).fillna("")
+        df.columns = self.columns
+
+        return df[df.ne("").any(axis=1)].reset_index(drop=True)
+
     @abstractmethod
     def parse_row(self, row: List[Any]) -> T:
         """
@@ -50,25 +50,5 @@ class PositionRepository(BaseSheetRepository[PositionRow]):
         )
 
     def parse_row(self, row: List[Any]) -> PositionRow:
-        return PositionRow(
-        symbol=row[0] if len(row) > 0 else None,
-        name=row[1] if len(row) > 1 else None,
-        market=row[2] if len(row) > 2 else None,
-        qty=row[3] if len(row) > 3 else None,
-        avg_price_current_currency=row[4] if len(row) > 4 else None,
-        current_price_current_currency=row[5] if len(row) > 5 else None,
-        avg_price_krw=row[6] if len(row) > 6 else None,
-        current_price_krw=row[7] if len(row) > 7 else None,
-        market_value_krw=row[8] if len(row) > 8 else None,
-        unrealized_pnl_krw=row[9] if len(row) > 9 else None,
-        unrealized_pnl_pct=row[10] if len(row) > 10 else None,
-        strategy=row[11] if len(row) > 11 else None,
-        atr=row[12] if len(row) > 12 else None,
-        atr_pct=row[13] if len(row) > 13 else None,
-        last_atr_pct=row[14] if len(row) > 14 else None,
-        atr_stop=row[15] if len(row) > 15 else None,
-        atr_target=row[16] if len(row) > 16 else None,
-        sector=row[17] if len(row) > 17 else None,
-        tag=row[18] if len(row) > 18 else None,
-        note=row[19] if len(row) > 19 else None,
-        )
+        # 필드 순서 = 컬럼 순서, _normalize_row 로 길이 보장 (짧은 행은 필드 기본값 None)
+        return PositionRow(*row)
@@ -51,26 +51,5 @@ class TLedgerRepository(BaseSheetRepository[TLedgerRow]):
         )
 
     def parse_row(self, row: List[Any]) -> TLedgerRow:
-        return TLedgerRow(
-        timestamp=row[0] if len(row) > 0 else None,
-        symbol=row[1] if len(row) > 1 else None,
-        market=row[2] if len(row) > 2 else None,
-        side=row[3] if len(row) > 3 else None,
-        qty=row[4] if len(row) > 4 else None,
-        price=row[5] if len(row) > 5 else None,
-        amount_local=row[6] if len(row) > 6 else None,
-        currency=row[7] if len(row) > 7 else None,
-        fx_rate=row[8] if len(row) > 8 else None,
-        amount_krw=row[9] if len(row) > 9 else None,
-        fee_tax=row[10] if len(row) > 10 else None,
-        net_amount_krw=row[11] if len(row) > 11 else None,
-        order_id=row[12] if len(row) > 12 else None,
-        strategy=row[13] if len(row) > 13 else None,
-        position_after=row[14] if len(row) > 14 else None,
-        hold_days=row[15] if len(row) > 15 else None,
-        pnl=row[16] if len(row) > 16 else None,
-        pnl_pct=row[17] if len(row) > 17 else None,
-        tag=row[18] if len(row) > 18 else None,
-        broker=row[19] if len(row) > 19 else None,
-        note=row[20] if len(row) > 20 else None,
-        )
+        # 필드 순서 = 컬럼 순서, _normalize_row 로 길이 보장 (짧은 행은 필드 기본값 None)
+        return TLedgerRow(*row)
@@ -0,0 +1,66 @@
+# src/sheets/async_sheets_client.py
+# GoogleSheetsClient 비동기 facade
+# gspread 는 동기 API → 스레드 풀에서 실행해 서로 독립적인 시트 호출을 동시에 진행
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List
+
+from .google_client import GoogleSheetsClient
+
+# 동시 실행 스레드 수 / 동시 요청 상한 (Sheets 분당 쿼터 보호)
+ASYNC_MAX_WORKERS = 4
+ASYNC_MAX_CONCURRENCY = 5
+
+
+class AsyncSheetsClient:
+    """
+    GoogleSheetsClient 메서드를 run_in_executor 로 감싼 coroutine 버전
+    - 인증 세션 / 커넥션 풀은 감싼 GoogleSheetsClient 와 공유
+    - 서로 독립적인 조회는 gather() 로 동시에 실행 → 소요시간 sum(t) → max(t)
+
+    예)
+        dt_rows, pos_rows, equity = await async_gs.gather(
+            dt_repo.load_all,
+            position_repo.load_positions,
+            history_repo.get_latest_equity,
+        )
+    """
+
+    def __init__(
+        self,
+        gs: GoogleSheetsClient,
+        max_workers: int = ASYNC_MAX_WORKERS,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ):
+        self.gs = gs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sheets")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def gather(self, *calls: Callable[[], Any]) -> List[Any]:
+        """인자 없는 동기 호출들을 동시에 실행, 결과는 전달 순서와 동일"""
+        return list(await asyncio.gather(*(self.run(call) for call in calls)))
+
+    # ------------------------------------------------------------
+    # GoogleSheetsClient 메서드 (async)
+    # ------------------------------------------------------------
+    async def read_range(self, worksheet_name: str, range_a1: str) -> List[List]:
+        return await self.run(self.gs.read_range, worksheet_name, range_a1)
+
+    async def read_cell(self, worksheet_name: str, cell_a1: str):
+        return await self.run(self.gs.read_cell, worksheet_name, cell_a1)
+
+    async def batch_read(self, ranges: List[str]) -> List[List[List]]:
+        return await self.run(self.gs.batch_read, ranges)
+
+    async def append_rows(self, worksheet_name: str, rows: List[List]) -> None:
+        await self.run(self.gs.append_rows, worksheet_name, rows)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
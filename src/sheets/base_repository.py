@@ -1,12 +1,16 @@
 # src/sheets/base_repository.py
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 from .schema_registry import SchemaRegistry, SheetSchema
 from .google_client import GoogleSheetsClient
 
 
+# with_row=True 조회 시 각 레코드에 붙는 시트 행 번호(1-based) 키
+ROW_KEY = "_row"
+
+
 class BaseSheetRepository:
     def __init__(
         self,
@@ -28,63 +32,96 @@ class BaseSheetRepository:
         # 유지: row_start (기본 2행)
         self.row_start = self.schema.row_start
 
+        # 스키마는 고정 → 행 변환용 (컬럼 인덱스, python_key) / 범위 컬럼 문자 1회 계산
+        self._key_idx = [
+            (idx, col_def["python_key"])
+            for idx, col_def in enumerate(self.schema.columns)
+            if col_def.get("python_key")
+        ]
+        self._row_keys = [col_def.get("python_key") for col_def in self.schema.columns]
+        if self.schema.columns:
+            self._first_col = self.schema.columns[0]["col"]
+            self._last_col = self.schema.columns[-1]["col"]
+
     # ---- 공통 유틸 ----
     def _build_a1_range(self, start_row: int, end_row: int) -> str:
         if not self.schema.columns:
             raise ValueError(f"No columns defined for sheet: {self.sheet_name}")
-        first_col = self.schema.columns[0]["col"]
-        last_col = self.schema.columns[-1]["col"]
-        return f"{first_col}{start_row}:{last_col}{end_row}"
+        return f"{self._first_col}{start_row}:{self._last_col}{end_row}"
 
     def _row_to_dict(self, row: List[Any]) -> Dict[str, Any]:
         """
         시트 한 줄(row)을 python_key 기반 dict로 변환.
         """
-        record: Dict[str, Any] = {}
-        for idx, col_def in enumerate(self.schema.columns):
-            key = col_def.get("python_key")
-            if not key:
-                continue
-            if idx < len(row):
-                record[key] = row[idx]
-            else:
-                record[key] = None
-        return record
+        n = len(row)
+        return {key: (row[idx] if idx < n else None) for idx, key in self._key_idx}
 
     def _dict_to_row(self, record: Dict[str, Any]) -> List[Any]:
         """
         python_key dict를 시트의 컬럼 순서 행(list)로 변환.
         계산용/수식용 컬럼은 비워두면 된다.
         """
-        row: List[Any] = []
-        for col_def in self.schema.columns:
-            key = col_def.get("python_key")
-            if not key:
-                row.append("")  # 또는 None
-            else:
-                row.append(record.get(key, ""))
-        return row
+        get = record.get
+        return [get(key, "") if key else "" for key in self._row_keys]
 
     # ---- 공통 메서드 ----
-    def load_all(self, max_rows: int = 2000) -> List[Dict[str, Any]]:
+    def load_all(self, max_rows: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         row_start부터 max_rows까지 읽어 dict 리스트로 반환.
-        빈 행만 나온 이후는 무시하는 형태로 최적화 가능.
+        max_rows=None 이면 시트 끝까지 (원장 집계 등 전체 행이 필요한 경우).
+        """
+        return list(self.iter_all(max_rows))
+
+    def iter_all(self, max_rows: Optional[int] = None, with_row: bool = False) -> Iterator[Dict[str, Any]]:
         """
-        start = self.row_start
-        end = self.row_start + max_rows - 1
-        a1 = self._build_a1_range(start, end)
-        values = self.gs.read_range(self.sheet_name, a1) or []
-        records: List[Dict[str, Any]] = []
-
-        for idx, row in enumerate(values):
-            # 완전히 빈 행이면 이후는 스킵해도 됨
-            if not any(str(cell).strip() for cell in row):
-                # 여기서 break를 걸면 더 빠르지만 상황에 따라 조정
+        load_all 과 같은 범위를 행 단위 generator 로 반환.
+        첫 일치 행만 필요한 호출측은 조기 종료로 나머지 행 변환 생략.
+        with_row=True 이면 각 레코드에 시트 행 번호(ROW_KEY) 포함 → 부분 업데이트용
+        """
+        values = self.gs.read_range(self.sheet_name, self._load_a1(max_rows)) or []
+        return self.iter_values(values, with_row=with_row)
+
+    def _load_a1(self, max_rows: Optional[int]) -> str:
+        if not self.schema.columns:
+            raise ValueError(f"No columns defined for sheet: {self.sheet_name}")
+        return self.schema.data_range(max_rows)
+
+    def load_range(self, max_rows: Optional[int] = None) -> str:
+        """
+        load_all 과 같은 범위의 시트명 포함 A1 표기 (values.batchGet 용)
+        예) 'DT_Report'!A2:V2001, max_rows=None 이면 'DT_Report'!A2:V
+        """
+        return f"'{self.sheet_name}'!{self._load_a1(max_rows)}"
+
+    def parse_values(self, values: List[List[Any]]) -> List[Dict[str, Any]]:
+        """
+        values.get / batchGet 응답 행들을 dict 리스트로 변환 (빈 행 제외)
+        """
+        return list(self.iter_values(values))
+
+    def iter_values(self, values: List[List[Any]], with_row: bool = False) -> Iterator[Dict[str, Any]]:
+        row_to_dict = self._row_to_dict
+
+        for i, row in enumerate(values):
+            # 빈 셀은 "" → any() (C 레벨) 로 대부분의 빈 행 판정
+            # 공백만 있는 셀이 섞인 경우만 strip 검사 (데이터 행은 첫 셀에서 종료)
+            # ※ values.get 응답은 끝쪽 빈 행을 생략하므로 break 없이 중간 빈 행만 스킵
+            if not any(row) or not any(str(cell).strip() for cell in row):
                 continue
-            records.append(self._row_to_dict(row))
-        return records
+            record = row_to_dict(row)
+            if with_row:
+                record[ROW_KEY] = self.row_start + i
+            yield record
 
     def append(self, record: Dict[str, Any]) -> None:
         row = self._dict_to_row(record)
         self.gs.append_row(self.sheet_name, row)
+
+    def append_many(self, records: List[Dict[str, Any]]) -> None:
+        """
+        여러 레코드를 values.append 1회 호출로 추가.
+        """
+        if not records:
+            return
+        rows = [self._dict_to_row(record) for record in records]
+        self.gs.append_rows(self.sheet_name, rows)
@@ -0,0 +1,54 @@
+# src/sheets/config_repository.py
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional
+
+from .base_repository import BaseSheetRepository
+from .schema_registry import SchemaRegistry
+from .google_client import GoogleSheetsClient
+
+
+# Config 값 캐시 유지 시간 (초). Config 는 거의 바뀌지 않으나 주문 경로에서 반복 조회됨
+CONFIG_CACHE_TTL_SEC = 300
+
+
+class ConfigRepository(BaseSheetRepository):
+    """
+    Config 시트 (category / subcategory / key / value / description) 조회.
+    - 최초 조회 시 표 전체를 values.get 1회로 읽어 key → value dict 캐시
+    - TTL 이내 재조회는 HTTP 없이 dict 조회
+    """
+
+    def __init__(
+        self,
+        schema_registry: SchemaRegistry,
+        gs: GoogleSheetsClient,
+        ttl_sec: float = CONFIG_CACHE_TTL_SEC,
+    ):
+        super().__init__(schema_registry, "Config", gs)
+        self.ttl_sec = ttl_sec
+        self._values: Optional[Dict[str, Any]] = None
+        self._loaded_at = 0.0
+
+    def _load_values(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        if self._values is None or now - self._loaded_at > self.ttl_sec:
+            self._values = {
+                str(r.get("key")).strip(): r.get("value")
+                for r in self.iter_all(max_rows=500)
+                if r.get("key")
+            }
+            self._loaded_at = now
+        return self._values
+
+    def get_config_value(self, key: str, default: Any = None) -> Any:
+        return self._load_values().get(key, default)
+
+    def get_kis_mode(self, default: str = "VTS") -> str:
+        value = self.get_config_value("KIS_MODE")
+        return str(value).strip().upper() if value else default
+
+    def invalidate(self) -> None:
+        """Config 시트 수정 직후 즉시 반영이 필요할 때 호출"""
+        self._values = None
@@ -1,7 +1,10 @@
 # src/sheets/dt_report_repository.py
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import logging
+import weakref
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
 
 from .base_repository import BaseSheetRepository
 from .schema_registry import SchemaRegistry
@@ -11,10 +14,57 @@ from .google_client import GoogleSheetsClient
 from engine.trading.models import OrderResult  # 예시 경로
 
 
+logger = logging.getLogger(__name__)
+
+# _trade_row 가 채우는 입력 컬럼 (python_key, 값 tuple 순서)
+# 그 밖의 컬럼(name, position_size, hold_days, pnl, pnl_pct, tag, note)은 빈 값 / 시트 수식
+TRADE_KEYS = (
+    "no", "date", "time", "symbol", "market", "side", "qty", "price",
+    "amount_local", "currency", "fx_rate", "amount_krw", "fee_tax",
+    "net_amount_krw", "strategy",
+)
+
+def _flush_rows(gs: GoogleSheetsClient, sheet_name: str, outbox: List[List[Any]]) -> None:
+    # 실패 시 outbox 유지 (다음 flush 에서 재시도)
+    if not outbox:
+        return
+    gs.append_rows(sheet_name, list(outbox))
+    outbox.clear()
+
+
+def _flush_at_exit(gs: GoogleSheetsClient, sheet_name: str, outbox: List[List[Any]]) -> None:
+    try:
+        _flush_rows(gs, sheet_name, outbox)
+    except Exception:
+        logger.exception("DT_Report 미기록 %d건 flush 실패", len(outbox))
+
+
 class DTReportRepository(BaseSheetRepository):
-    def __init__(self, schema_registry: SchemaRegistry, gs: GoogleSheetsClient):
+    def __init__(
+        self,
+        schema_registry: SchemaRegistry,
+        gs: GoogleSheetsClient,
+        buffered: bool = False,
+    ):
         super().__init__(schema_registry, "DT_Report", gs)
 
+        # buffered=True: write_trade(s) 는 outbox 에 쌓고 flush() 시 values.append 1회
+        # (틱 종료 시 flush 호출, 누락분은 GC / 인터프리터 종료 시 flush)
+        self.buffered = buffered
+        self._outbox: List[List[Any]] = []
+        if buffered:
+            weakref.finalize(self, _flush_at_exit, gs, self.sheet_name, self._outbox)
+
+        # 다음 No. 시트 조회는 프로세스 최초 1회, 이후 기록 성공 시 메모리에서 증가
+        self._next_no: Optional[int] = None
+
+        # 시트 컬럼 순서 → _trade_row 값 tuple 위치 (없는 키는 마지막 빈 값)
+        blank = len(TRADE_KEYS)
+        self._trade_getter = itemgetter(*[
+            TRADE_KEYS.index(key) if key in TRADE_KEYS else blank
+            for key in self._row_keys
+        ])
+
     def load_recent(self, n: int = 100) -> List[Dict[str, Any]]:
         all_rows = self.load_all(max_rows=n)
         return all_rows
@@ -22,21 +72,32 @@ class DTReportRepository(BaseSheetRepository):
     def get_next_no(self) -> int:
         """
         A열(No) 기준으로 마지막 번호 + 1 반환.
-        (단순 구현: 마지막 행 번호를 읽고 +1)
+        No 열 1개만 UNFORMATTED_VALUE 로 조회 → 숫자 셀은 int/float 그대로 (행 dict 변환 없음)
+        마지막 행까지 조회 (상한을 두면 그 아래 번호를 놓쳐 No 중복 기록)
         """
-        rows = self.load_all(max_rows=2000)
-        if not rows:
-            return 1
-        # 마지막 유효 행의 no 컬럼 읽기
+        no_col = self.col_by_key.get("no", self._first_col)
+        start = self.row_start
+        values = self.gs.read_range(
+            self.sheet_name,
+            f"{no_col}{start}:{no_col}",
+            value_render_option="UNFORMATTED_VALUE",
+        ) or []
+
         last_no = 0
-        for r in rows:
-            try:
-                no_val = int(r.get("no") or 0)
-                if no_val > last_no:
-                    last_no = no_val
-            except ValueError:
+        for row in values:
+            if not row:
+                continue
+            no_val = row[0]
+            if no_val.__class__ is str:
+                # 텍스트로 저장된 번호
+                if not no_val.isdigit():
+                    continue
+                no_val = int(no_val)
+            elif no_val.__class__ not in (int, float):
                 continue
-        return last_no + 1
+            if no_val > last_no:
+                last_no = no_val
+        return int(last_no) + 1
 
     def write_trade(self, result: OrderResult) -> None:
         """
@@ -44,28 +105,70 @@ class DTReportRepository(BaseSheetRepository):
         계산 컬럼(PnL, PnL_Pct 등)은 시트 수식에 맡기고, 입력 필드만 채운다.
         auto_trading_system.schema.json의 컬럼 키를 기준으로 매핑. :contentReference[oaicite:5]{index=5}
         """
-        record: Dict[str, Any] = {
-            "no": self.get_next_no(),
-            "date": result.timestamp.strftime("%Y-%m-%d"),
-            "time": result.timestamp.strftime("%H:%M:%S"),
-            "symbol": result.symbol,
-            "name": "",  # 종목명은 별도 데이터 소스 또는 시트 수식으로 채울 수 있음
-            "market": result.market,
-            "side": result.side,
-            "qty": result.qty,
-            "price": result.avg_price,
-            "amount_local": result.amount_local,
-            "currency": result.currency,
-            "fx_rate": result.fx_rate,
-            "amount_krw": result.amount_krw,
-            "fee_tax": result.fee_tax,
-            "net_amount_krw": result.amount_krw - result.fee_tax,
-            "strategy": result.raw.get("strategy", "") if result.raw else "",
-            "position_size": "",  # 체결 후 보유 수량은 Position에서 관리 가능
-            "hold_days": "",
-            "pnl": "",
-            "pnl_pct": "",
-            "tag": "",
-            "note": "",
-        }
-        self.append(record)
+        no = self._peek_next_no()
+        row = self._trade_row(result, no)
+        if self.buffered:
+            self._outbox.append(row)
+        else:
+            self.gs.append_row(self.sheet_name, row)
+        self._next_no = no + 1
+
+    def write_trades(self, results: List[OrderResult]) -> None:
+        """
+        여러 OrderResult 를 한 번에 기록.
+        - 다음 No 는 최초 1회만 조회 후 순차 증가
+        - 행 추가는 values.append 1회
+        """
+        if not results:
+            return
+        next_no = self._peek_next_no()
+        trade_row = self._trade_row
+        rows = [trade_row(result, next_no + i) for i, result in enumerate(results)]
+        if self.buffered:
+            self._outbox.extend(rows)
+        else:
+            self.gs.append_rows(self.sheet_name, rows)
+        self._next_no = next_no + len(rows)
+
+    def flush(self) -> None:
+        """
+        outbox 에 쌓인 기록을 values.append 1회로 전송 (buffered=False 면 no-op)
+        """
+        _flush_rows(self.gs, self.sheet_name, self._outbox)
+
+    def _peek_next_no(self) -> int:
+        """
+        다음 No 반환 (증가는 기록 성공 후 호출측에서).
+        DT_Report 기록 주체는 이 프로세스 하나라는 전제 → 시트 재조회 생략
+        """
+        if self._next_no is None:
+            self._next_no = self.get_next_no()
+        return self._next_no
+
+    def _trade_row(self, result: OrderResult, no: int) -> List[Any]:
+        """
+        OrderResult → 시트 컬럼 순서 행 (dict 중간 단계 없음).
+        계산/수식용 컬럼(name, position_size, pnl 등)은 빈 값.
+        """
+        # "YYYY-MM-DD HH:MM:SS" 1회 포맷 후 슬라이스 (strftime 2회 대신)
+        stamp = result.timestamp.isoformat(" ", "seconds")
+        raw = result.raw
+        values = (
+            no,
+            stamp[:10],
+            stamp[11:19],
+            result.symbol,
+            result.market,
+            result.side,
+            result.qty,
+            result.avg_price,
+            result.amount_local,
+            result.currency,
+            result.fx_rate,
+            result.amount_krw,
+            result.fee_tax,
+            result.amount_krw - result.fee_tax,
+            raw.get("strategy", "") if raw else "",
+            "",  # TRADE_KEYS 에 없는 컬럼용 빈 값
+        )
+        return list(self._trade_getter(values))
@@ -1,22 +1,215 @@
-import gspread
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+import gspread
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Sheets API 커넥션 풀 / 재시도 설정
+#   POOL_MAXSIZE 는 동시 호출 스레드 수(AsyncSheetsClient 워커 등) 이상으로 유지
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.3
+
+# 프로세스 공용 캐시
+#   - 인증 클라이언트: credentials 파일별 1개 (OAuth 토큰 / TLS 커넥션 풀 공유)
+#   - Spreadsheet: (credentials 파일, spreadsheet_id) 별 1개 (open_by_key 1회)
+_CLIENT_CACHE: Dict[str, gspread.Client] = {}
+_SPREADSHEET_CACHE: Dict[Tuple[str, str], gspread.Spreadsheet] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def create_sheets_adapter() -> HTTPAdapter:
+    """
+    sheets.googleapis.com 호출용 HTTPAdapter
+    - keep-alive 커넥션 풀 재사용
+    - 429(쿼터) / 5xx 는 backoff 재시도 (Retry-After 헤더 우선)
+    - 재시도 소진 시 마지막 응답을 그대로 반환 → gspread APIError 로 처리
+      (raise_on_status=True 면 requests.RetryError 로 바뀌어 호출측 예외 처리와 어긋남)
+    """
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+def get_authorized_client(credentials_path: str) -> gspread.Client:
+    """
+    credentials 파일별 인증 클라이언트 1개를 프로세스 전체에서 공유.
+    gspread 의 HTTP 세션은 AuthorizedSession(requests.Session) → 풀링 어댑터 장착
+    """
+    cache_key = str(Path(credentials_path).resolve())
+    with _CACHE_LOCK:
+        gc = _CLIENT_CACHE.get(cache_key)
+        if gc is None:
+            gc = gspread.service_account(filename=credentials_path)
+            gc.http_client.session.mount("https://", create_sheets_adapter())
+            _CLIENT_CACHE[cache_key] = gc
+        return gc
 
 
 class GoogleSheetsClient:
-    def __init__(self, credentials_path: str, spreadsheet_id: str):
+    def __init__(self, *, credentials_path: str, spreadsheet_id: str):
         """
         ATS용 Google Sheets Client
+        생성 시에는 설정만 저장, 인증/open_by_key 는 connect() (또는 최초 호출) 시 1회
 
         parameters
         ----------
         credentials_path : service account json
         spreadsheet_id   : spreadsheet의 고유 ID
         """
+        self.credentials_path = credentials_path
         self.spreadsheet_id = spreadsheet_id
-        self.gc = gspread.service_account(filename=credentials_path)
-        self.sh = self.gc.open_by_key(self.spreadsheet_id)
+        self.gc: Optional[gspread.Client] = None
+        self.sh: Optional[gspread.Spreadsheet] = None
+
+    @classmethod
+    def from_env(cls) -> "GoogleSheetsClient":
+        """
+        .env 의 GOOGLE_SHEET_KEY / GOOGLE_CREDENTIALS_FILE 기반 프로세스 공용 인스턴스
+        """
+        return _client_from_env()
+
+    def connect(self) -> "GoogleSheetsClient":
+        if self.sh is not None:
+            return self
+
+        self.gc = get_authorized_client(self.credentials_path)
+
+        cache_key = (str(Path(self.credentials_path).resolve()), self.spreadsheet_id)
+        with _CACHE_LOCK:
+            sh = _SPREADSHEET_CACHE.get(cache_key)
+            if sh is None:
+                sh = self.gc.open_by_key(self.spreadsheet_id)
+                _SPREADSHEET_CACHE[cache_key] = sh
+        self.sh = sh
+        return self
+
+    def _spreadsheet(self) -> gspread.Spreadsheet:
+        if self.sh is None:
+            self.connect()
+        return self.sh
+
+    @staticmethod
+    def _a1(worksheet_name: str, range_a1: str) -> str:
+        # 시트명 포함 A1 표기 (작은따옴표는 '' 로 escape)
+        return "'{}'!{}".format(worksheet_name.replace("'", "''"), range_a1)
+
+    # ------------------------------------------------------------
+    # 조회 / 기록은 Spreadsheet 단위 values.* 엔드포인트를 직접 호출
+    #   sh.worksheet(name) 은 시트 메타데이터 조회(HTTP 1회)가 추가되므로 사용하지 않음
+    #   → 시트명 포함 A1 범위로 호출 1회 = HTTP 1회
+    # ------------------------------------------------------------
+    def read_range(
+        self,
+        worksheet_name: str,
+        range_a1: str,
+        value_render_option: Optional[str] = None,
+        date_time_render_option: Optional[str] = None,
+    ) -> List[List]:
+        """
+        value_render_option="UNFORMATTED_VALUE" 이면 숫자 셀은 int/float 그대로,
+        date_time_render_option="SERIAL_NUMBER" 이면 날짜 셀은 일련번호(1899-12-30 기준 일수)로 반환
+        """
+        params = {}
+        if value_render_option:
+            params["valueRenderOption"] = value_render_option
+        if date_time_render_option:
+            params["dateTimeRenderOption"] = date_time_render_option
+
+        resp = self._spreadsheet().values_get(self._a1(worksheet_name, range_a1), params=params)
+        return resp.get("values", [])
+
+    def read_cell(self, worksheet_name: str, cell_a1: str):
+        """
+        단일 셀 값 조회 (values.get 1회, 셀 1개 전송). 빈 셀은 None
+        """
+        values = self.read_range(worksheet_name, cell_a1)
+        if values and values[0]:
+            return values[0][0]
+        return None
+
+    def batch_read(self, ranges: List[str]) -> List[List[List]]:
+        """
+        여러 범위를 values.batchGet 1회 호출로 조회.
+        ranges 는 시트명 포함 A1 표기 (예: "Config!C92"), 결과는 요청 순서와 동일.
+        """
+        resp = self._spreadsheet().values_batch_get(ranges)
+        return [vr.get("values", []) for vr in resp.get("valueRanges", [])]
+
+    def write_range(
+        self,
+        worksheet_name: str,
+        range_a1: str,
+        values: List[List],
+        value_input_option: str = "USER_ENTERED",
+    ) -> None:
+        """
+        지정 범위만 values.update 1회 호출로 덮어쓰기
+        """
+        self._spreadsheet().values_update(
+            self._a1(worksheet_name, range_a1),
+            params={"valueInputOption": value_input_option},
+            body={"values": values},
+        )
+
+    def batch_write(self, data: List[Dict], value_input_option: str = "USER_ENTERED") -> None:
+        """
+        여러 범위를 values.batchUpdate 1회 호출로 덮어쓰기.
+        data 항목: {"range": "Position!D5:E5", "values": [[qty, avg_price]]}
+        """
+        if not data:
+            return
+        self._spreadsheet().values_batch_update(
+            body={"valueInputOption": value_input_option, "data": data}
+        )
+
+    def append_row(
+        self,
+        worksheet_name: str,
+        row: List,
+        value_input_option: str = "USER_ENTERED",
+    ) -> None:
+        """
+        한 행을 values.append 1회 호출로 추가.
+        범위 A1 → Google 이 A1 부터 이어지는 표 끝 첫 빈 행에 원자적으로 삽입 (행 번호 조회 불필요)
+        """
+        self.append_rows(worksheet_name, [row], value_input_option)
+
+    def append_rows(
+        self,
+        worksheet_name: str,
+        rows: List[List],
+        value_input_option: str = "USER_ENTERED",
+    ) -> None:
+        """
+        여러 행을 values.append 1회 호출로 추가 (행마다 append_row 호출 시 429 유발).
+        """
+        if not rows:
+            return
+        self._spreadsheet().values_append(
+            self._a1(worksheet_name, "A1"),
+            params={"valueInputOption": value_input_option},
+            body={"values": rows},
+        )
+
+
+@lru_cache(maxsize=1)
+def _client_from_env() -> GoogleSheetsClient:
+    from core.settings import settings
 
-    def read_range(self, worksheet_name: str, range_a1: str) -> List[List]:
-        ws = self.sh.worksheet(worksheet_name)
-        return ws.get(range_a1)
+    return GoogleSheetsClient(
+        credentials_path=settings.google_credentials_file,
+        spreadsheet_id=settings.google_sheet_key,
+    )
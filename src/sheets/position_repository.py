@@ -1,49 +1,124 @@
 # src/sheets/position_repository.py
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from .base_repository import BaseSheetRepository
+from .base_repository import BaseSheetRepository, ROW_KEY
 from .schema_registry import SchemaRegistry
 from .google_client import GoogleSheetsClient
-from engine.trading.models import OrderResult  # 예시 경로
+from engine.trading.models import OrderResult, OrderSide  # 예시 경로
+
+
+# find_position 조회용 인덱스 유지 시간 (초). 한 틱 안의 반복 조회는 시트 1회 조회로 처리
+POSITION_INDEX_TTL_SEC = 5.0
 
 
 class PositionRepository(BaseSheetRepository):
     def __init__(self, schema_registry: SchemaRegistry, gs: GoogleSheetsClient):
         super().__init__(schema_registry, "Position", gs)
 
-    def load_positions(self) -> List[Dict[str, Any]]:
-        return self.load_all(max_rows=500)
+        # (symbol, market) / (symbol, None) → position. None 이면 미로드
+        self._positions_index: Optional[Dict[Tuple[str, Optional[str]], Dict[str, Any]]] = None
+        self._index_loaded_at = 0.0
+
+    def load_positions(self, with_row: bool = False) -> List[Dict[str, Any]]:
+        # 전체 행 조회 (상한을 두면 그 아래 행의 종목을 신규로 보고 중복 행 추가)
+        return list(self.iter_all(with_row=with_row))
+
+    def _ensure_index(self, ttl: float = POSITION_INDEX_TTL_SEC) -> Dict[Tuple[str, Optional[str]], Dict[str, Any]]:
+        now = time.monotonic()
+        if self._positions_index is None or now - self._index_loaded_at > ttl:
+            index: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+            for pos in self.load_positions():
+                symbol = pos.get("symbol")
+                # 같은 종목이 여러 행이면 첫 행 우선 (기존 선형 탐색과 동일)
+                index.setdefault(_position_key(symbol, pos.get("market")), pos)
+                index.setdefault((symbol, None), pos)
+            self._positions_index = index
+            self._index_loaded_at = now
+        return self._positions_index
+
+    def invalidate_index(self) -> None:
+        self._positions_index = None
 
     def find_position(self, symbol: str, market: str | None = None) -> Dict[str, Any] | None:
-        for pos in self.load_positions():
-            if pos.get("symbol") == symbol and (market is None or pos.get("market") == market):
-                return pos
-        return None
+        # TTL 내 반복 조회는 인덱스 dict 조회 (시트 재조회 / 선형 탐색 없음)
+        return self._ensure_index().get(_position_key(symbol, market))
 
     def update_with_result(self, result: OrderResult) -> None:
+        self.update_with_results([result])
+
+    def update_with_results(self, results: List[OrderResult]) -> None:
         """
-        OrderResult 기반으로 Position 시트를 업데이트.
+        OrderResult 목록 기반으로 Position 시트를 업데이트.
         - BUY: 수량 증가 / 평균단가 재계산
-        - SELL: 수량 감소 / 0이 되면 행 제거 또는 0 표시
-        여기서는 스캐폴드 수준으로 'TODO' 형태로 남겨두고,
-        실제 시트 업데이트는 후속 단계에서 구체화한다.
+        - SELL: 수량 감소 (0 이 되면 0 표시, 행은 유지)
+        - 기존 행: 로드 시 기억한 행 번호로 qty / avg_price 셀만 values.batchUpdate 1회
+        - 신규 종목(BUY): values.append 1회
+        - 행 매칭은 find_position 과 같은 (symbol, market) 키, 중복 행은 첫 행 우선
         """
-        # 1) 전체 포지션 읽기
-        positions = self.load_positions()
-
-        # 2) 심볼 매칭
-        #   - 실제 구현에서는 시트 행 번호까지 함께 관리하는 편이 좋다.
-        #   - 지금은 스캐폴드이므로 pseudo 코드 수준으로 둔다.
-        # TODO: 시트 행 인덱스를 함께 관리하여 update_range 호출
-
-        # 예시 placeholder:
-        # if result.side == "BUY":
-        #     ...
-        # elif result.side == "SELL":
-        #     ...
-
-        # 현재 단계에서는 단순히 "읽기 기반 설계"까지만 두고,
-        # 실제 update 로직은 Position 수식/구조가 확정된 다음 채운다.
-        pass
+        if not results:
+            return
+
+        positions: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        for pos in self.load_positions(with_row=True):
+            positions.setdefault(_position_key(pos.get("symbol"), pos.get("market")), pos)
+        touched: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        new_rows: List[Dict[str, Any]] = []
+
+        for result in results:
+            key = _position_key(result.symbol, result.market)
+            pos = positions.get(key)
+            qty = _to_float(pos.get("qty")) if pos else 0.0
+            avg_price = _to_float(pos.get("avg_price")) if pos else 0.0
+
+            if result.side == OrderSide.BUY:
+                new_qty = qty + result.qty
+                new_avg = (qty * avg_price + result.qty * result.avg_price) / new_qty if new_qty else 0.0
+            else:
+                new_qty = max(qty - result.qty, 0.0)
+                new_avg = avg_price
+
+            if pos is None:
+                if new_qty <= 0:
+                    continue
+                pos = {
+                    "symbol": result.symbol,
+                    "market": result.market,
+                    "strategy": result.raw.get("strategy", "") if result.raw else "",
+                }
+                positions[key] = pos
+                new_rows.append(pos)
+
+            pos["qty"] = new_qty
+            pos["avg_price"] = new_avg
+            if ROW_KEY in pos:
+                touched[key] = pos
+
+        qty_col = self.col_by_key["qty"]
+        avg_col = self.col_by_key["avg_price"]
+        data = []
+        for pos in touched.values():
+            row = pos[ROW_KEY]
+            data.append({"range": f"'{self.sheet_name}'!{qty_col}{row}", "values": [[pos["qty"]]]})
+            data.append({"range": f"'{self.sheet_name}'!{avg_col}{row}", "values": [[pos["avg_price"]]]})
+
+        self.gs.batch_write(data)
+        self.append_many(new_rows)
+        self.invalidate_index()
+
+
+def _position_key(symbol: Any, market: Any) -> Tuple[Any, Optional[str]]:
+    # 시트 셀은 "KR" 문자열, OrderResult.market 은 MarketType → 값 문자열로 통일
+    if market is None:
+        return symbol, None
+    return symbol, str(getattr(market, "value", market)).strip().upper()
+
+
+def _to_float(value: Any) -> float:
+    # 시트 셀은 "1,234" 형태 문자열일 수 있음
+    try:
+        return float(str(value).replace(",", "").strip() or 0)
+    except ValueError:
+        return 0.0
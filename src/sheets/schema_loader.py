@@ -1,9 +1,11 @@
 # src/sheets/schema_loader.py
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from core.config_loader import read_json_cached
+from sheets.sheet_range import data_range as sheet_data_range
+
 
 @dataclass
 class SheetColumn:
@@ -23,11 +25,21 @@ class SheetSchema:
     relations: Optional[Dict] = None
     blocks: Optional[Dict] = None
 
+    def __post_init__(self):
+        self.first_col = self.columns[0].col if self.columns else "A"
+        self.last_col = self.columns[-1].col if self.columns else "A"
+        self.data_start = self.row_start
+
+        # 컬럼 순서의 python_key (행 → dict 변환용, 스키마 고정 → 1회 계산)
+        self.python_keys = tuple(col_def.python_key for col_def in self.columns)
+
+    def data_range(self, max_rows: Optional[int] = None) -> str:
+        return sheet_data_range(self.first_col, self.last_col, self.data_start, max_rows)
+
 
 class SchemaRegistry:
     def __init__(self, schema_path: Path):
-        with schema_path.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
+        raw = read_json_cached(schema_path)
 
         self.version = raw.get("version")
         self.project = raw.get("project")
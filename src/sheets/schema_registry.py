@@ -1,7 +1,10 @@
 # src/sheets/schema_registry.py
-import json
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Dict, Optional
+
+from core.config_loader import read_json_cached
+from sheets.sheet_range import data_range as sheet_data_range
 
 
 class SheetSchema:
@@ -13,19 +16,38 @@ class SheetSchema:
         self.primary_key = raw.get("primary_key", [])
         self.blocks = raw.get("blocks", {})
 
+        self.first_col: str = self.columns[0]["col"] if self.columns else "A"
+        self.last_col: str = self.columns[-1]["col"] if self.columns else "A"
+        self.data_start: int = self.row_start
+
         # python_key -> column letter (e.g. "symbol" -> "A")
-        self._col_by_key = {
-            col_def.get("python_key"): col_def.get("col")
-            for col_def in self.columns
-            if col_def.get("python_key")
-        }
+        # 로드 후 변경 없음 → 읽기 전용 view 로 고정 (스레드 간 공유 안전)
+        keys = [col_def.get("python_key") for col_def in self.columns]
+        letters = [col_def.get("col") for col_def in self.columns]
+        self._col_by_key = MappingProxyType({
+            key: letter for key, letter in zip(keys, letters) if key
+        })
 
     def get_column_letter(self, python_key: str) -> str | None:
         return self._col_by_key.get(python_key)
 
+    def data_range(self, max_rows: Optional[int] = None) -> str:
+        return sheet_data_range(self.first_col, self.last_col, self.data_start, max_rows)
+
     def get_blocks(self) -> Dict[str, Any]:
         return self.blocks
 
+    def freeze(self) -> SimpleNamespace:
+        """
+        블록 셀 주소 / 컬럼 문자를 속성 접근용 namespace 로 미리 풀어둠.
+        예) ns.Summary.initial_equity_investment, ns.columns.symbol
+        """
+        blocks = {
+            block_name: SimpleNamespace(**cells) if isinstance(cells, dict) else cells
+            for block_name, cells in self.blocks.items()
+        }
+        return SimpleNamespace(columns=SimpleNamespace(**self._col_by_key), **blocks)
+
 
 class SchemaRegistry:
     def __init__(self, schema_path: Path):
@@ -34,8 +56,7 @@ class SchemaRegistry:
         self._load()
 
     def _load(self) -> None:
-        with self.schema_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_cached(self.schema_path)
 
         sheets_raw = data.get("sheets", {})
         for sheet_name, sheet_def in sheets_raw.items():
@@ -51,3 +72,13 @@ class SchemaRegistry:
 
     def all_sheet_names(self) -> list[str]:
         return list(self._schemas.keys())
+
+    def freeze(self) -> SimpleNamespace:
+        """
+        전체 시트의 셀 주소를 1회 해석한 namespace.
+        예) ns.Position.Summary.initial_equity_investment
+        """
+        return SimpleNamespace(**{
+            sheet_name: schema.freeze()
+            for sheet_name, schema in self._schemas.items()
+        })
@@ -0,0 +1,15 @@
+# src/sheets/sheet_range.py
+# 스키마 데이터 범위(A1) 계산 — schema_registry / schema_loader 의 SheetSchema 공용
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=256)
+def data_range(first_col: str, last_col: str, row_start: int, max_rows: Optional[int] = None) -> str:
+    """
+    row_start 부터 max_rows 행의 A1 범위 (예: "A2:V2001")
+    max_rows=None 이면 마지막 행까지 열린 범위 (예: "A2:V")
+    스키마는 불변 → (컬럼, 시작 행, 행 수) 별 문자열을 1회만 생성
+    """
+    end_row = "" if max_rows is None else row_start + max_rows - 1
+    return f"{first_col}{row_start}:{last_col}{end_row}"
@@ -0,0 +1,41 @@
+# src/sheets/sheet_rows.py
+# schema_loader 기반 저장소 공통 행 로드 (DT_Report / History / Position)
+from typing import Any, Dict, Iterator, List, Optional
+
+from sheets.schema_loader import SchemaRegistry, SheetSchema
+from sheets.google_client import GoogleSheetsClient
+
+
+class SheetRowsRepository:
+    """
+    schema_loader.SheetSchema 기반 저장소 공통부 (DT_Report / History / Position)
+    - 행 → dict 는 스키마 컬럼 순서의 python_key 와 zip
+    - 빈 셀은 "" 로 내려오므로 any() 로 빈 행 제외
+    """
+
+    def __init__(self, schema_registry: SchemaRegistry, sheet_name: str, gs: GoogleSheetsClient):
+        self.schema: SheetSchema = schema_registry.get(sheet_name)
+        self.gs = gs
+
+    def row_to_dict(self, row: List[str]) -> Dict[str, Any]:
+        return dict(zip(self.schema.python_keys, row))
+
+    def _read_rows(self, max_rows: Optional[int]) -> List[List[Any]]:
+        return self.gs.read_range(self.schema.name, self.schema.data_range(max_rows)) or []
+
+    def iter_rows(self, max_rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        빈 행을 제외한 행을 dict 로 하나씩 생성 (조기 종료 시 나머지 행 변환 생략)
+        """
+        keys = self.schema.python_keys
+        for r in self._read_rows(max_rows):
+            if any(r):
+                yield dict(zip(keys, r))
+
+    def load_all(self, max_rows: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        빈 행을 제외한 전체 행 (max_rows=None 이면 마지막 행까지).
+        generator 경유 없이 comprehension 1회로 생성
+        """
+        keys = self.schema.python_keys
+        return [dict(zip(keys, r)) for r in self._read_rows(max_rows) if any(r)]
@@ -0,0 +1,36 @@
+# src/sheets/sheets_facade.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from .base_repository import BaseSheetRepository
+from .google_client import GoogleSheetsClient
+
+
+class SheetsFacade:
+    """
+    여러 Repository 의 load_all 을 values.batchGet 1회 호출로 묶어 조회.
+    - 범위 계산 / 행 변환은 각 Repository 의 load_range / parse_values 재사용
+    - 결과는 sheet_name → load_all 과 동일한 dict 리스트
+    """
+
+    def __init__(self, gs: GoogleSheetsClient, repositories: Iterable[BaseSheetRepository]):
+        self.gs = gs
+        self.repositories: Dict[str, BaseSheetRepository] = {
+            repo.sheet_name: repo for repo in repositories
+        }
+
+    def load_many(
+        self,
+        sheet_names: List[str],
+        max_rows: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        repos = [self.repositories[name] for name in sheet_names]
+        if not repos:
+            return {}
+
+        values_list = self.gs.batch_read([repo.load_range(max_rows) for repo in repos])
+        return {
+            repo.sheet_name: repo.parse_values(values)
+            for repo, values in zip(repos, values_list)
+        }
@@ -0,0 +1,31 @@
+# tests/brokers/conftest.py
+
+import dataclasses
+import time
+
+import pytest
+
+from brokers import kis_broker
+from brokers.kis_broker import KISBroker
+
+
+@pytest.fixture
+def make_broker(monkeypatch, tmp_path):
+    """
+    토큰 캐시는 tmp_path, warm-up / DNS 고정은 끈 KISBroker 생성기.
+    with_token=True 이면 유효 토큰을 미리 넣어 발급 호출 생략
+    """
+    monkeypatch.setattr(kis_broker, "TOKEN_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(
+        kis_broker, "settings",
+        dataclasses.replace(kis_broker.settings, kis_warmup=False, kis_pin_dns=False),
+    )
+
+    def _make(session, with_token=True):
+        broker = KISBroker(mode="VTS")
+        broker.session = session
+        if with_token:
+            broker._set_token("TOKEN", time.time() + 3600)
+        return broker
+
+    return _make
@@ -0,0 +1,45 @@
+# tests/brokers/fake_session.py
+
+import json
+import threading
+
+
+# --------------------------------------------------------
+# KIS REST 응답 / 세션 fake (네트워크 호출 없음)
+# --------------------------------------------------------
+class FakeResponse:
+    def __init__(self, body, headers=None, status=200):
+        self.content = json.dumps(body).encode("utf-8")
+        self.text = self.content.decode("utf-8")
+        self.headers = headers or {}
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+
+class FakeSession:
+    """
+    get 은 준비된 응답을 순서대로 반환하고 호출 인자를 기록.
+    post 는 on_post() 결과 반환 (토큰 발급), 호출 횟수는 스레드 안전하게 집계
+    """
+
+    def __init__(self, responses=(), on_post=None):
+        self.responses = list(responses)
+        self.get_calls = []
+        self.on_post = on_post
+        self.post_calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, params=None):
+        self.get_calls.append({"url": url, "headers": dict(headers), "params": dict(params)})
+        return self.responses.pop(0)
+
+    def post(self, url, headers=None, data=None):
+        with self._lock:
+            self.post_calls += 1
+        return self.on_post()
+
+    def close(self):
+        pass
@@ -0,0 +1,75 @@
+# tests/brokers/test_kis_broker.py
+
+from tests.brokers.fake_session import FakeResponse, FakeSession
+
+
+def test_get_price_parses_current_price(make_broker):
+    session = FakeSession([FakeResponse({"output": {"stck_prpr": "70100"}})])
+    broker = make_broker(session)
+
+    assert broker.get_price("005930") == 70100.0
+
+    call = session.get_calls[0]
+    assert call["params"]["FID_INPUT_ISCD"] == "005930"
+    assert call["headers"]["tr_id"] == "FHKST01010100"
+    assert call["headers"]["authorization"] == "Bearer TOKEN"
+
+
+def test_get_price_returns_zero_on_http_error(make_broker):
+    broker = make_broker(FakeSession([FakeResponse({}, status=500)]))
+
+    assert broker.get_price("005930") == 0.0
+
+
+def test_get_account_snapshot_parses_balance_and_positions(make_broker):
+    body = {
+        "output1": [
+            {"pdno": "005930", "hldg_qty": "10", "pchs_avg_pric": "70000",
+             "evlu_amt": "710000", "evlu_pfls_amt": "10000"},
+        ],
+        "output2": [{"tot_evlu_amt": "1710000", "dnca_tot_amt": "1000000", "evlu_pfls_smtl_amt": "10000"}],
+    }
+    broker = make_broker(FakeSession([FakeResponse(body)]))
+
+    snapshot = broker.get_account_snapshot()
+
+    assert snapshot["balance"] == {"total_equity": 1710000.0, "cash": 1000000.0, "pnl_total": 10000.0}
+    assert snapshot["positions"] == [{
+        "symbol": "005930", "qty": 10.0, "avg_price": 70000.0,
+        "valuation": 710000.0, "pnl": 10000.0,
+    }]
+
+
+def test_get_account_snapshot_on_http_error(make_broker):
+    broker = make_broker(FakeSession([FakeResponse({}, status=500)]))
+
+    assert broker.get_account_snapshot() == {"balance": None, "positions": []}
+
+
+def test_inquire_balance_follows_continuation_pages(make_broker):
+    page1 = FakeResponse(
+        {
+            "output1": [{"pdno": "005930"}, {"pdno": "000660"}],
+            "output2": [{"tot_evlu_amt": "1000"}],
+            "ctx_area_fk100": "FK-1",
+            "ctx_area_nk100": "NK-1",
+        },
+        headers={"tr_cont": "M"},
+    )
+    page2 = FakeResponse(
+        {"output1": [{"pdno": "035720"}], "output2": [{"tot_evlu_amt": "0"}]},
+        headers={"tr_cont": "D"},
+    )
+    session = FakeSession([page1, page2])
+    broker = make_broker(session)
+
+    snapshot = broker._inquire_balance()
+
+    assert [row["pdno"] for row in snapshot["output1"]] == ["005930", "000660", "035720"]
+    assert snapshot["output2"] == [{"tot_evlu_amt": "1000"}]
+
+    first, second = session.get_calls
+    assert "tr_cont" not in first["headers"]
+    assert first["params"]["CTX_AREA_FK100"] == ""
+    assert second["headers"]["tr_cont"] == "N"
+    assert (second["params"]["CTX_AREA_FK100"], second["params"]["CTX_AREA_NK100"]) == ("FK-1", "NK-1")
@@ -0,0 +1,68 @@
+# tests/brokers/test_kis_token.py
+
+import threading
+import time
+
+from brokers import kis_broker
+from tests.brokers.fake_session import FakeResponse, FakeSession
+
+N_CALLERS = 8
+
+
+def _run_concurrently(target, n=N_CALLERS):
+    """n 개 스레드가 barrier 후 동시에 target 호출 → (결과 목록, 예외 목록)"""
+    barrier = threading.Barrier(n)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(target())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return results, errors
+
+
+def _slow_token_response():
+    time.sleep(0.05)  # 발급 중 다른 스레드가 대기 경로로 들어오도록
+    return FakeResponse({"access_token": "NEW-TOKEN"})
+
+
+def test_get_token_issues_once_for_concurrent_callers(make_broker):
+    session = FakeSession(on_post=_slow_token_response)
+    broker = make_broker(session, with_token=False)
+
+    results, errors = _run_concurrently(broker.get_token)
+
+    assert errors == []
+    assert results == ["NEW-TOKEN"] * N_CALLERS
+    assert session.post_calls == 1
+    assert kis_broker.get_cached_token("VTS")["access_token"] == "NEW-TOKEN"
+
+
+def test_get_token_retries_after_leader_failure(make_broker):
+    outcomes = iter([RuntimeError("token endpoint down")])
+
+    def on_post():
+        time.sleep(0.05)
+        failure = next(outcomes, None)
+        if failure is not None:
+            raise failure
+        return FakeResponse({"access_token": "NEW-TOKEN"})
+
+    session = FakeSession(on_post=on_post)
+    broker = make_broker(session, with_token=False)
+
+    results, errors = _run_concurrently(broker.get_token)
+
+    # 실패한 leader 만 예외, 대기 스레드는 재시도로 새 토큰 획득
+    assert len(errors) == 1
+    assert results == ["NEW-TOKEN"] * (N_CALLERS - 1)
+    assert session.post_calls == 2
+    assert broker._refreshing is None
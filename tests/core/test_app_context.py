@@ -0,0 +1,41 @@
+# tests/core/test_app_context.py
+
+import core.app_context as app_context_module
+from core.app_context import AppContext
+
+
+class CountingBroker:
+    instances = 0
+
+    def __init__(self, mode=None):
+        type(self).instances += 1
+        self.mode = mode
+
+    def get_price(self, symbol):
+        return 0.0
+
+
+def test_single_broker_shared_across_components(monkeypatch):
+    """PortfolioEngine / OrderExecutor / PriceService 가 같은 KISBroker / PriceService 하나를 공유"""
+    CountingBroker.instances = 0
+    monkeypatch.setattr(app_context_module, "KISBroker", CountingBroker)
+
+    # 시트/스키마 연결 없이 lazy 구성요소만 검증
+    ctx = AppContext.__new__(AppContext)
+    ctx.kis_mode = "VTS"
+    ctx.settings = {}
+    ctx.schema = None
+    ctx.gs = None
+    ctx._initial_cash_vals = [["1,000"]]
+    ctx.__dict__["position_repo"] = object()
+    ctx.__dict__["dt_repo"] = object()
+    ctx.__dict__["sheets"] = None
+
+    portfolio = ctx.portfolio
+    executor = ctx.order_executor
+    prices = ctx.price_service
+
+    assert CountingBroker.instances == 1
+    assert portfolio.broker is executor.broker is prices.broker is ctx.broker
+    assert portfolio.price_service is prices
+    assert portfolio.initial_cash == 1000.0
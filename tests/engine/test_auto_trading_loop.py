@@ -0,0 +1,33 @@
+# tests/engine/test_auto_trading_loop.py
+
+from engine.auto_trading_loop import AutoTradingLoop, IDLE_BACKOFF_AFTER, IDLE_MAX_MULTIPLIER
+
+
+def _loop(in_hours=True):
+    loop = AutoTradingLoop(None, None, None, None, None)
+    loop._in_trading_hours = lambda: in_hours
+    return loop
+
+
+def test_idle_backoff_doubles_after_threshold():
+    loop = _loop()
+
+    for _ in range(IDLE_BACKOFF_AFTER - 1):
+        loop._update_idle(False)
+    assert loop.idle_multiplier == 1
+
+    loop._update_idle(False)
+    assert loop.idle_multiplier == 2
+
+    loop._update_idle(True)
+    assert (loop.idle_ticks, loop.idle_multiplier) == (0, 1)
+
+
+def test_idle_resets_when_market_opens():
+    loop = _loop(in_hours=False)
+    loop._update_idle(False)
+    assert loop.idle_multiplier == IDLE_MAX_MULTIPLIER
+
+    loop._in_trading_hours = lambda: True
+    loop._update_idle(False)
+    assert (loop.idle_ticks, loop.idle_multiplier) == (1, 1)
@@ -0,0 +1,87 @@
+# tests/engine/test_order_executor_batch.py
+
+from engine.trading.models import OrderRequest, OrderSide, MarketType
+from engine.trading.order_executor import OrderExecutor, BATCH_ORDER_LIMIT
+
+
+class BatchBroker:
+    def __init__(self):
+        self.calls = []
+
+    def batch_buy(self, orders):
+        self.calls.append(("BUY", len(orders)))
+        return [{"order_id": f"B-{o.symbol}"} for o in orders]
+
+    def batch_sell(self, orders):
+        self.calls.append(("SELL", len(orders)))
+        return [{"order_id": f"S-{o.symbol}"} for o in orders]
+
+
+def _order(symbol, side):
+    return OrderRequest(symbol=symbol, market=MarketType.KR, side=side, qty=1)
+
+
+def test_execute_batch_groups_by_side_and_keeps_order():
+    broker = BatchBroker()
+    executor = OrderExecutor(broker)
+
+    n_buy = BATCH_ORDER_LIMIT + 1
+    orders = [_order(str(i), OrderSide.BUY) for i in range(n_buy)]
+    orders.insert(1, _order("X", OrderSide.SELL))
+
+    results = executor.execute_batch(orders)
+
+    assert broker.calls == [("BUY", BATCH_ORDER_LIMIT), ("BUY", 1), ("SELL", 1)]
+    assert [r.symbol for r in results] == [o.symbol for o in orders]
+    assert results[1].order_id == "S-X"
+
+
+class ResultBroker:
+    returns_order_result = True
+
+    def buy(self, order):
+        return "declared-result"
+
+
+def test_declared_order_result_is_passed_through():
+    executor = OrderExecutor(ResultBroker())
+
+    assert executor.execute(_order("A", OrderSide.BUY)) == "declared-result"
+
+
+def test_compact_raw_keeps_mapping_reads():
+    executor = OrderExecutor(BatchBroker(), use_compact_raw=True)
+
+    result = executor.execute_batch([_order("A", OrderSide.BUY)])[0]
+
+    assert type(result.raw) is not dict
+    assert result.raw.get("order_id") == "B-A"
+    assert result.raw.get("strategy", "") == ""
+    assert result.raw == {"order_id": "B-A"}
+
+
+class SideBroker:
+    def buy(self, order):
+        return {"order_id": f"B-{order.symbol}"}
+
+    def sell(self, order):
+        return {"order_id": f"S-{order.symbol}"}
+
+
+def test_execute_accepts_plain_string_side():
+    executor = OrderExecutor(SideBroker())
+
+    assert executor.execute(_order("A", "BUY")).order_id == "B-A"
+    assert executor.execute(_order("B", "SELL")).order_id == "S-B"
+
+
+def test_execute_batch_assigns_every_order_a_result():
+    broker = BatchBroker()
+    executor = OrderExecutor(broker)
+    orders = [_order("A", "BUY"), _order("B", OrderSide.SELL), _order("C", "SELL")]
+
+    results = executor.execute_batch(orders)
+
+    assert None not in results
+    assert [r.order_id for r in results] == ["B-A", "S-B", "S-C"]
+    assert broker.calls == [("BUY", 1), ("SELL", 2)]
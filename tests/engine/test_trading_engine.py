@@ -0,0 +1,116 @@
+# tests/engine/test_trading_engine.py
+
+from engine.trading.models import (
+    MarketType, OrderRequest, OrderResult, OrderSide, TradeSignal,
+)
+from engine.trading.trading_engine import TradingEngine
+
+
+class FakeValidator:
+    def validate_signal(self, signal):
+        return signal.strategy != "REJECT"
+
+    def validate_order(self, order_req):
+        return True
+
+
+class FakeSizer:
+    def __init__(self):
+        self.calls = []
+
+    def begin_batch(self):
+        self.calls.append("begin")
+
+    def end_batch(self):
+        self.calls.append("end")
+
+    def from_signal(self, signal):
+        return OrderRequest(symbol=signal.symbol, market=signal.market, side=signal.side, qty=1)
+
+
+class FakeExecutor:
+    def __init__(self):
+        self.batches = []
+
+    def execute_batch(self, orders):
+        self.batches.append([o.symbol for o in orders])
+        return [
+            OrderResult(
+                f"ID-{o.symbol}", o.symbol, o.market, o.side, o.qty,
+                100, 0, 100, "KRW", 1, 100, "TEST",
+            )
+            for o in orders
+        ]
+
+
+class FakeDTRepo:
+    def __init__(self):
+        self.written = []
+        self.flushes = 0
+
+    def write_trade(self, result):
+        self.written.append([result.symbol])
+
+    def write_trades(self, results):
+        self.written.append([r.symbol for r in results])
+
+    def flush(self):
+        self.flushes += 1
+
+
+class FakePositionRepo:
+    def __init__(self):
+        self.updates = []
+
+    def update_with_results(self, results):
+        self.updates.append([r.symbol for r in results])
+
+
+class FakeHistoryRepo:
+    def __init__(self):
+        self.updates = []
+
+    def update_after_trade(self, result):
+        self.updates.append(result.symbol)
+
+
+def _engine():
+    return TradingEngine(
+        dt_repo=FakeDTRepo(),
+        pos_repo=FakePositionRepo(),
+        hist_repo=FakeHistoryRepo(),
+        validator=FakeValidator(),
+        sizer=FakeSizer(),
+        executor=FakeExecutor(),
+    )
+
+
+def _signal(symbol, strategy="TEST"):
+    return TradeSignal(symbol=symbol, market=MarketType.KR, side=OrderSide.BUY, strategy=strategy)
+
+
+def test_process_all_drains_queue_into_one_batch_and_flushes():
+    engine = _engine()
+    for signal in (_signal("A"), _signal("B", strategy="REJECT"), _signal("C")):
+        engine.submit_signal(signal)
+
+    engine.process_all()
+
+    assert engine.queue.is_empty()
+    assert engine.sizer.calls == ["begin", "end"]
+    assert engine.executor.batches == [["A", "C"]]
+    assert engine.dt_repo.written == [["A", "C"]]
+    assert engine.pos_repo.updates == [["A", "C"]]
+    assert engine.hist_repo.updates == ["A", "C"]
+    assert engine.dt_repo.flushes == 1
+
+
+def test_process_all_without_orders_skips_execution():
+    engine = _engine()
+    engine.submit_signal(_signal("A", strategy="REJECT"))
+
+    engine.process_all()
+
+    assert engine.queue.is_empty()
+    assert engine.executor.batches == []
+    assert engine.dt_repo.flushes == 0
@@ -0,0 +1,50 @@
+# tests/sheets/test_history_repository.py
+
+from sheets.history_repository import HistoryRepository
+from sheets.schema_registry import SheetSchema
+
+COLUMNS = [
+    {"col": "A", "python_key": "date"},
+    {"col": "B", "python_key": "total_equity"},
+]
+
+
+class FakeRegistry:
+    def __init__(self, blocks=None):
+        self.blocks = blocks or {}
+
+    def get(self, sheet_name):
+        return SheetSchema(sheet_name, {"columns": COLUMNS, "row_start": 2, "blocks": self.blocks})
+
+
+class FakeSheets:
+    def __init__(self, cell, rows):
+        self.cell = cell
+        self.rows = rows
+        self.cell_reads = []
+
+    def read_cell(self, worksheet_name, cell):
+        self.cell_reads.append(cell)
+        return self.cell
+
+    def read_range(self, worksheet_name, range_a1, **kwargs):
+        return self.rows
+
+
+ROWS = [[45000, 1000], [45002, 1200], [45001, 1100]]
+
+
+def test_latest_equity_scans_rows_without_declared_cell():
+    gs = FakeSheets(cell="999", rows=ROWS)
+    repo = HistoryRepository(FakeRegistry(), gs)
+
+    assert repo.get_latest_equity() == 1200.0
+    assert gs.cell_reads == []
+
+
+def test_latest_equity_reads_declared_summary_cell():
+    gs = FakeSheets(cell="1,500", rows=ROWS)
+    repo = HistoryRepository(FakeRegistry({"Summary": {"latest_equity": "D2"}}), gs)
+
+    assert repo.get_latest_equity() == 1500.0
+    assert gs.cell_reads == ["D2"]
@@ -0,0 +1,95 @@
+# tests/sheets/test_position_repository.py
+
+from engine.trading.models import OrderResult, OrderSide, MarketType
+from sheets.position_repository import PositionRepository
+from sheets.schema_registry import SheetSchema
+
+COLUMNS = [
+    {"col": "A", "python_key": "symbol"},
+    {"col": "B", "python_key": "market"},
+    {"col": "C", "python_key": "qty"},
+    {"col": "D", "python_key": "avg_price"},
+    {"col": "E", "python_key": "strategy"},
+]
+
+
+class FakeRegistry:
+    def get(self, sheet_name):
+        return SheetSchema(sheet_name, {"columns": COLUMNS, "row_start": 2})
+
+
+class FakeSheets:
+    def __init__(self, values):
+        self.values = values
+        self.read_ranges = []
+        self.batch_writes = []
+        self.appended = []
+
+    def read_range(self, worksheet_name, range_a1):
+        self.read_ranges.append(range_a1)
+        return self.values
+
+    def batch_write(self, data):
+        self.batch_writes.append(data)
+
+    def append_rows(self, worksheet_name, rows):
+        self.appended.extend(rows)
+
+
+def _result(symbol, side, qty, price):
+    return OrderResult(
+        "1", symbol, MarketType.KR, side, qty,
+        price, 0, qty * price, "KRW", 1, qty * price, "TEST",
+    )
+
+
+def test_update_with_results_writes_known_rows_in_one_batch():
+    gs = FakeSheets([
+        ["005930", "KR", "10", "100", ""],
+        ["", "", "", "", ""],
+        ["000660", "KR", "5", "200", ""],
+    ])
+    repo = PositionRepository(FakeRegistry(), gs)
+
+    repo.update_with_results([
+        _result("005930", OrderSide.BUY, 10, 200),
+        _result("000660", OrderSide.SELL, 5, 250),
+        _result("035420", OrderSide.BUY, 1, 300),
+    ])
+
+    assert gs.batch_writes == [[
+        {"range": "'Position'!C2", "values": [[20]]},
+        {"range": "'Position'!D2", "values": [[150.0]]},
+        {"range": "'Position'!C4", "values": [[0.0]]},
+        {"range": "'Position'!D4", "values": [[200.0]]},
+    ]]
+    assert gs.appended == [["035420", MarketType.KR, 1.0, 300.0, ""]]
+
+
+def test_load_all_reads_to_last_row_by_default():
+    gs = FakeSheets([["005930", "KR", "10", "100", ""]])
+    repo = PositionRepository(FakeRegistry(), gs)
+
+    repo.load_all()
+    repo.load_all(max_rows=10)
+
+    assert gs.read_ranges == ["A2:E", "A2:E11"]
+
+
+def test_update_with_results_matches_first_row_by_symbol_and_market():
+    gs = FakeSheets([
+        ["005930", "US", "1", "10", ""],
+        ["005930", "KR", "10", "100", ""],
+        ["005930", "KR", "99", "999", ""],
+    ])
+    repo = PositionRepository(FakeRegistry(), gs)
+
+    assert repo.find_position("005930", MarketType.KR)["qty"] == "10"
+
+    repo.update_with_results([_result("005930", OrderSide.BUY, 10, 200)])
+
+    assert gs.batch_writes == [[
+        {"range": "'Position'!C3", "values": [[20.0]]},
+        {"range": "'Position'!D3", "values": [[150.0]]},
+    ]]
+    assert gs.appended == []
@@ -1,80 +1,87 @@
 # tests/test_trading_engine_virtual.py
 
-import sys
-import os
-
-# --------------------------------------------------------
-# 1) 정확한 PYTHONPATH 설정 (테스트 환경 안정화)
-# --------------------------------------------------------
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-TESTS_DIR = os.path.abspath(os.path.dirname(__file__))
-
-# 프로젝트 루트 및 src, tests 폴더 모두 추가
-sys.path.insert(0, ROOT_DIR)
-sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
-sys.path.insert(0, TESTS_DIR)
-
 # --------------------------------------------------------
-# 2) 정상 import 가능한지 확인
+# Virtual TradingEngine 통합 테스트 (실시트 미사용)
+# 실제 OrderExecutor + VirtualBroker + DTReportRepository,
+# 시트 클라이언트 / 검증 / 사이징 / 포지션·히스토리 저장소는 in-memory fake
 # --------------------------------------------------------
-from pathlib import Path
-
-from core.app_context import AppContext
-from engine.trading.models import TradeSignal, OrderSide, MarketType
 from brokers.virtual_broker import VirtualBroker
+from engine.trading.models import TradeSignal, OrderSide, MarketType
 from engine.trading.order_executor import OrderExecutor
-
-# 여기서 import 실패하면 tests/mock_price_service.py 위치 오류!
+from engine.trading.trading_engine import TradingEngine
+from sheets.dt_report_repository import DTReportRepository, TRADE_KEYS
+from sheets.schema_registry import SheetSchema
+from tests.engine.test_trading_engine import (
+    FakeHistoryRepo, FakePositionRepo, FakeSizer, FakeValidator,
+)
 from tests.mock_price_service import MockPriceService
 
+# DT_Report 입력 컬럼만 A.. 순서로 배치
+DT_COLUMNS = [
+    {"col": chr(ord("A") + i), "python_key": key}
+    for i, key in enumerate(TRADE_KEYS)
+]
 
-# --------------------------------------------------------
-# 3) 테스트 루틴
-# --------------------------------------------------------
-def run_virtual_test():
-    print("=== Virtual TradingEngine Test Start ===")
 
-    # 1) AppContext 생성
-    ctx = AppContext(Path("."))
+class FakeRegistry:
+    def get(self, sheet_name):
+        return SheetSchema(sheet_name, {"columns": DT_COLUMNS, "row_start": 2})
 
-    # 2) PriceService mock 적용
-    mock_price_service = MockPriceService()
-    ctx.price_service = mock_price_service
 
-    # 3) Virtual Broker 사용
-    ctx.broker = VirtualBroker(price_service=mock_price_service)
+class FakeSheets:
+    """No 열 조회는 기존 행 1건(No=7) 반환, append 행은 기록"""
 
-    # 4) OrderExecutor 교체
-    ctx.order_executor = OrderExecutor(ctx.broker)
-    ctx.trading_engine.executor = ctx.order_executor
+    def __init__(self):
+        self.appended = []
 
-    print("[TEST] Virtual broker + mock price service 적용 완료")
+    def read_range(self, worksheet_name, range_a1, value_render_option=None):
+        return [[7]]
 
-    # 5) 시그널 생성
-    signal = TradeSignal(
-        symbol="005930",
-        market=MarketType.KR,
-        side=OrderSide.BUY,
-        strategy="TEST_STRATEGY"
-    )
+    def append_row(self, worksheet_name, row):
+        self.appended.append(row)
 
-    # 6) 실행
-    ctx.trading_engine.submit_signal(signal)
-    ctx.trading_engine.process_all()
+    def append_rows(self, worksheet_name, rows):
+        self.appended.extend(rows)
 
-    print("[TEST] TradingEngine process_all() 실행 완료")
-
-    # 7) DT_Report 기록 조회
-    recent = ctx.dt_repo.load_recent(3)
-    print("[TEST] 최근 DT_Report 기록:")
-    for r in recent:
-        print(r)
-
-    print("=== Virtual TradingEngine Test Finished ===")
 
+def test_virtual_trading_engine():
+    gs = FakeSheets()
+    executor = OrderExecutor(VirtualBroker(price_service=MockPriceService()))
+    engine = TradingEngine(
+        dt_repo=DTReportRepository(FakeRegistry(), gs),
+        pos_repo=FakePositionRepo(),
+        hist_repo=FakeHistoryRepo(),
+        validator=FakeValidator(),
+        sizer=FakeSizer(),
+        executor=executor,
+    )
+    fills = []
+    executor.add_fill_listener(fills.append)
 
-# --------------------------------------------------------
-# 4) 메인 실행
-# --------------------------------------------------------
-if __name__ == "__main__":
-    run_virtual_test()
+    engine.submit_signal(TradeSignal(
+        symbol="005930",
+        market=MarketType.KR,
+        side=OrderSide.BUY,
+        strategy="TEST_STRATEGY",
+    ))
+    engine.process_all()
+
+    # 1) 실행 결과 (MockPriceService: 항상 70,000원, FakeSizer: 1주)
+    assert len(fills) == 1
+    result = fills[0]
+    assert result.broker == "VIRTUAL"
+    assert (result.symbol, result.side, result.qty) == ("005930", OrderSide.BUY, 1)
+    assert result.avg_price == 70000
+    assert result.amount_krw == 70000
+
+    # 2) DT_Report 기록 행 (No 는 기존 최댓값 + 1)
+    assert len(gs.appended) == 1
+    row = dict(zip(TRADE_KEYS, gs.appended[0]))
+    assert row["no"] == 8
+    assert row["symbol"] == "005930"
+    assert row["side"] == OrderSide.BUY
+    assert (row["qty"], row["price"], row["amount_krw"]) == (1, 70000, 70000)
+    assert row["net_amount_krw"] == 70000
+
+    assert engine.pos_repo.updates == [["005930"]]
+    assert engine.hist_repo.updates == ["005930"]
@@ -1,31 +1,40 @@
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]   # Auto_Trading_System 폴더
 SRC = ROOT / "src"
 
-# 잘못된 패턴: from src.xxx import Y
-pattern = re.compile(r"from\s+src\.([a-zA-Z0-9_\.]+)\s+import\s+(.*)")
+# 파일 읽기/쓰기는 I/O 대기 위주 → 스레드로 겹쳐 처리
+MAX_WORKERS = 16
 
-# 잘못된 패턴: import src.xxx
-pattern2 = re.compile(r"import\s+src\.([a-zA-Z0-9_\.]+)")
+# 잘못된 패턴: from src.xxx import Y / import src.xxx
+# 파일 전체를 MULTILINE 정규식 1회 치환 (줄 단위 분할 + 줄마다 search 2회 대신)
+pattern = re.compile(
+    r"^([ \t]*)(?:from\s+src\.([a-zA-Z0-9_\.]+)\s+import\s+(.*)|import\s+src\.([a-zA-Z0-9_\.]+))[ \t]*$",
+    re.MULTILINE,
+)
+
+def fix_match(m: re.Match) -> str:
+    indent = m.group(1)
 
-def fix_line(line: str):
     # 패턴1: from src.xxx import Y
-    m = pattern.search(line)
-    if m:
-        module = m.group(1)
-        imports = m.group(2)
-        return f"from {module} import {imports}\n"
+    if m.group(2) is not None:
+        return f"{indent}from {m.group(2)} import {m.group(3)}"
 
     # 패턴2: import src.xxx
-    m2 = pattern2.search(line)
-    if m2:
-        module = m2.group(1)
-        return f"import {module}\n"
+    return f"{indent}import {m.group(4)}"
+
+
+def fix_file(file: Path) -> bool:
+    original = file.read_text(encoding="utf-8")
+    fixed = pattern.sub(fix_match, original)
 
-    return line
+    if fixed == original:
+        return False
+    file.write_text(fixed, encoding="utf-8")
+    return True
 
 
 def run():
@@ -35,23 +44,12 @@ def run():
 
     fixed_files = 0
 
-    for file in py_files:
-        original = file.read_text(encoding="utf-8")
-        lines = original.splitlines(keepends=True)
-
-        modified = False
-        new_lines = []
-
-        for line in lines:
-            new_line = fix_line(line)
-            if new_line != line:
-                modified = True
-            new_lines.append(new_line)
-
-        if modified:
-            file.write_text("".join(new_lines), encoding="utf-8")
-            print(f"[FixImports] Fixed: {file}")
-            fixed_files += 1
+    # map 은 입력 순서대로 결과 반환 → 출력 순서는 순차 처리와 동일
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for file, fixed in zip(py_files, executor.map(fix_file, py_files)):
+            if fixed:
+                print(f"[FixImports] Fixed: {file}")
+                fixed_files += 1
 
     print(f"[FixImports] Completed. Modified files: {fixed_files}")
 
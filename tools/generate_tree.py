@@ -1,13 +1,17 @@
 import os
+import sys
 
 def generate_tree(start_path="."):
+    # 줄마다 print 대신 모아서 stdout 1회 write
+    out = []
     for root, dirs, files in os.walk(start_path):
         level = root.replace(start_path, "").count(os.sep)
         indent = " " * 3 * level
-        print(f"{indent}{os.path.basename(root)}/")
+        out.append(f"{indent}{os.path.basename(root)}/\n")
         sub_indent = " " * 3 * (level + 1)
         for f in files:
-            print(f"{sub_indent}{f}")
+            out.append(f"{sub_indent}{f}\n")
+    sys.stdout.write("".join(out))
 
 if __name__ == "__main__":
     generate_tree("..")
@@ -167,14 +167,6 @@ class RepositoryGenerator:
             ]
         )
 
-        # parse_row 구현 (단순 매핑)
-        parse_lines = []
-        for idx, col_name in enumerate(sheet.columns):
-            field_name = self._to_python_field_name(col_name)
-            parse_lines.append(
-                f"        {field_name}=row[{idx}] if len(row) > {idx} else None,"
-            )
-
         repo_block = "\n".join(
             [
                 f"class {repo_class_name}(BaseSheetRepository[{row_class_name}]):",
@@ -195,9 +187,8 @@ class RepositoryGenerator:
                 "        )",
                 "",
                 "    def parse_row(self, row: List[Any]) -> " + row_class_name + ":",
-                f"        return {row_class_name}(",
-                *parse_lines,
-                "        )",
+                "        # 필드 순서 = 컬럼 순서, _normalize_row 로 길이 보장 (짧은 행은 필드 기본값 None)",
+                f"        return {row_class_name}(*row)",
                 "",
             ]
         )
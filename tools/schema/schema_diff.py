@@ -6,11 +6,12 @@ Introspector가 리스트 또는 딕셔너리 형태로 컬럼을 생성해도
 """
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import List, Dict, Any
 
 
-class ChangeLevel(Enum):
+# 값 = 심각도 순서 → IntEnum 비교로 max() 바로 사용
+class ChangeLevel(IntEnum):
     NONE = 0
     PATCH = 1
     MINOR = 2
@@ -25,7 +26,7 @@ class ChangeType(Enum):
     COLUMN_TYPE_CHANGED = "column_type_changed"
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaChange:
     path: str
     change_type: ChangeType
@@ -33,15 +34,16 @@ class SchemaChange:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaDiffResult:
     changes: List[SchemaChange]
 
     @property
     def level(self) -> ChangeLevel:
+        # changes 는 생성 후에도 추가될 수 있으므로 매번 계산 (IntEnum max 라 비용 작음)
         if not self.changes:
             return ChangeLevel.NONE
-        return max((c.level for c in self.changes), key=lambda x: x.value)
+        return max(c.level for c in self.changes)
 
 
 class SchemaDiffEngine:
@@ -56,18 +58,21 @@ class SchemaDiffEngine:
 
         normalized = {}
 
+        # 컬럼마다 속성 조회 / bound method 생성 반복 방지
+        normalize = self.normalize_column
+
         if isinstance(cols_raw, dict):
             # 이미 dict 기반
-            for key, val in cols_raw.items():
-                normalized[key] = self.normalize_column(val)
+            normalized = {key: normalize(val) for key, val in cols_raw.items()}
 
         elif isinstance(cols_raw, list):
             # 리스트 기반 → 이름 키로 dict 변환
             for col_item in cols_raw:
-                name = col_item.get("name") or col_item.get("column")
+                get = col_item.get
+                name = get("name") or get("column")
                 if not name:
                     continue
-                normalized[name] = self.normalize_column(col_item)
+                normalized[name] = normalize(col_item)
 
         else:
             # unexpected format
@@ -89,9 +94,13 @@ class SchemaDiffEngine:
             return {"column": col_val, "type": "unknown"}
 
         if isinstance(col_val, dict):
+            # datatype 은 type 이 없을 때만 조회 (기본값 인자로 매번 조회하지 않음)
+            col_type = col_val.get("type")
+            if col_type is None:
+                col_type = col_val.get("datatype", "unknown")
             return {
                 "column": col_val.get("column", "unknown"),
-                "type": col_val.get("type", col_val.get("datatype", "unknown"))
+                "type": col_type
             }
 
         return {"column": "unknown", "type": "unknown"}
@@ -118,9 +127,13 @@ class SchemaDiffEngine:
         old_sheets = old_schema.get("sheets", {})
         new_sheets = new_schema.get("sheets", {})
 
-        # 시트 추가
-        for sheet in new_sheets:
-            if sheet not in old_sheets:
+        # 시트 추가 / 삭제 / 컬럼 비교를 정렬된 합집합 1회 순회로 분류
+        # (차집합·교집합 3회 + 정렬 3회 대신 정렬 1회, 변경 목록 순서도 결정적)
+        for sheet in sorted(old_sheets.keys() | new_sheets.keys()):
+            in_old = sheet in old_sheets
+            in_new = sheet in new_sheets
+
+            if in_new and not in_old:
                 changes.append(
                     SchemaChange(
                         path=f"sheets.{sheet}",
@@ -129,10 +142,7 @@ class SchemaDiffEngine:
                         message=f"Sheet '{sheet}' added"
                     )
                 )
-
-        # 시트 삭제
-        for sheet in old_sheets:
-            if sheet not in new_sheets:
+            elif in_old and not in_new:
                 changes.append(
                     SchemaChange(
                         path=f"sheets.{sheet}",
@@ -141,26 +151,44 @@ class SchemaDiffEngine:
                         message=f"Sheet '{sheet}' removed"
                     )
                 )
+            else:
+                self._diff_columns(sheet, old_sheets[sheet], new_sheets[sheet], changes)
 
-        # 컬럼 비교
-        for sheet, new_meta in new_sheets.items():
-
-            if sheet not in old_sheets:
-                continue
-
-            old_meta = old_sheets[sheet]
-
-            new_cols = self.normalize_columns(new_meta.get("columns", {}))
-            old_cols = self.normalize_columns(old_meta.get("columns", {}))
+        return SchemaDiffResult(changes)
 
-            new_keys = set(new_cols.keys())
-            old_keys = set(old_cols.keys())
+    # ---------------------------------------------------------
+    # 시트 1개 컬럼 비교
+    # ---------------------------------------------------------
+    def _diff_columns(
+        self,
+        sheet: str,
+        old_meta: Dict[str, Any],
+        new_meta: Dict[str, Any],
+        changes: List[SchemaChange],
+    ) -> None:
+        old_raw = old_meta.get("columns", {})
+        new_raw = new_meta.get("columns", {})
+
+        # 같은 객체 / 같은 내용이면 정규화·컬럼별 비교 생략 (대부분의 시트는 변경 없음)
+        if old_raw is new_raw or old_raw == new_raw:
+            return
+
+        new_cols = self.normalize_columns(new_raw)
+        old_cols = self.normalize_columns(old_raw)
+
+        # 시트 단위 경로 prefix 는 컬럼 루프 밖에서 1회 포맷
+        prefix = f"sheets.{sheet}.columns."
+
+        # 추가 / 삭제 / 변경을 정렬된 합집합 1회 순회로 분류
+        for col in sorted(old_cols.keys() | new_cols.keys()):
+            in_old = col in old_cols
+            in_new = col in new_cols
 
             # 컬럼 추가
-            for col in new_keys - old_keys:
+            if in_new and not in_old:
                 changes.append(
                     SchemaChange(
-                        path=f"sheets.{sheet}.columns.{col}",
+                        path=f"{prefix}{col}",
                         change_type=ChangeType.COLUMN_ADDED,
                         level=ChangeLevel.PATCH,
                         message=f"Column '{col}' added"
@@ -168,26 +196,26 @@ class SchemaDiffEngine:
                 )
 
             # 컬럼 삭제
-            for col in old_keys - new_keys:
+            elif in_old and not in_new:
                 changes.append(
                     SchemaChange(
-                        path=f"sheets.{sheet}.columns.{col}",
+                        path=f"{prefix}{col}",
                         change_type=ChangeType.COLUMN_REMOVED,
                         level=ChangeLevel.MINOR,
                         message=f"Column '{col}' removed"
                     )
                 )
 
-            # 타입 변경
-            for col in new_keys & old_keys:
-                if new_cols[col] != old_cols[col]:
+            # 타입 변경 (컬럼 정의는 1회 조회 후 비교 / 메시지에 재사용)
+            else:
+                old_col = old_cols[col]
+                new_col = new_cols[col]
+                if new_col != old_col:
                     changes.append(
                         SchemaChange(
-                            path=f"sheets.{sheet}.columns.{col}",
+                            path=f"{prefix}{col}",
                             change_type=ChangeType.COLUMN_TYPE_CHANGED,
                             level=ChangeLevel.MINOR,
-                            message=f"Column '{col}' changed: {old_cols[col]} → {new_cols[col]}"
+                            message=f"Column '{col}' changed: {old_col} → {new_col}"
                         )
                     )
-
-        return SchemaDiffResult(changes)